@@ -0,0 +1,49 @@
+"""
+Benchmark du débit de convert_many face au chemin synchrone.
+
+Usage : python benchmarks/bench_async.py [conversions] [concurrence ...]
+"""
+import asyncio
+import logging
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from chimere import aio  # noqa: E402
+from chimere.core import convert, logger  # noqa: E402
+from chimere.types import JSONData, CSVData  # noqa: E402
+
+
+def _payloads(n):
+    return [JSONData('{"name": "Bob", "age": %d}' % i) for i in range(n)]
+
+
+def run(n, levels):
+    logger.setLevel(logging.WARNING)
+    payloads = _payloads(n)
+
+    start = time.perf_counter()
+    for obj in payloads:
+        convert(obj, CSVData)
+    elapsed = time.perf_counter() - start
+    print(f"{'mode':<24} {'concurrence':>11} {'secondes':>10} {'conv/s':>10}")
+    print(f"{'sync':<24} {1:>11} {elapsed:>10.3f} {n / elapsed:>10.0f}")
+
+    for level in levels:
+        executor = ThreadPoolExecutor(max_workers=level)
+        aio.configure(executor=executor, max_concurrency=level)
+        start = time.perf_counter()
+        asyncio.run(aio.convert_many(payloads, CSVData))
+        elapsed = time.perf_counter() - start
+        executor.shutdown()
+        print(f"{'convert_many (threads)':<24} {level:>11} {elapsed:>10.3f} {n / elapsed:>10.0f}")
+    aio.configure()
+
+
+if __name__ == '__main__':
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    levels = [int(v) for v in sys.argv[2:]] or [1, 8, 64, 256]
+    run(n, levels)
@@ -0,0 +1,54 @@
+"""
+Benchmark de conversions répétées de CSV de même forme : inférence pandas à
+chaque fois face au schéma mis en cache (types fixés, lecture pyarrow,
+catégories).
+
+Usage : python benchmarks/bench_csv_schema.py [fichiers] [lignes]
+"""
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from chimere.csv_schema import SCHEMA_CACHE, read_csv  # noqa: E402
+from chimere.types import CSVData  # noqa: E402
+
+COUNTRIES = ['FR', 'DE', 'ES', 'IT', 'BE', 'NL']
+STATUSES = ['ok', 'retry', 'failed']
+
+
+def _payload(seed, rows):
+    rng = random.Random(seed)
+    lines = ['id,country,status,latency,label']
+    for i in range(rows):
+        lines.append(f"{seed * rows + i},{rng.choice(COUNTRIES)},{rng.choice(STATUSES)},"
+                     f"{rng.random() * 100:.3f},event-{rng.randrange(10 ** 9)}")
+    return ('\n'.join(lines) + '\n').encode()
+
+
+def _run(payloads, cache):
+    start = time.perf_counter()
+    memory = 0
+    for payload in payloads:
+        df = read_csv(CSVData(payload), cache=cache)
+        memory += int(df.memory_usage(index=True, deep=True).sum())
+    return time.perf_counter() - start, memory // len(payloads)
+
+
+def run(files, rows):
+    payloads = [_payload(seed, rows) for seed in range(files)]
+    print(f"{files} CSV de {rows} lignes ({len(payloads[0]) / 1e6:.1f} Mo chacun)")
+    print(f"{'mode':<16} {'secondes':>10} {'fichiers/s':>11} {'Mo/DataFrame':>13}")
+    SCHEMA_CACHE.clear()
+    for mode, cache in (('inférence', None), ('schéma en cache', SCHEMA_CACHE)):
+        elapsed, memory = _run(payloads, cache)
+        print(f"{mode:<16} {elapsed:>10.3f} {files / elapsed:>11.1f} {memory / 1e6:>13.2f}")
+    print(f"cache : {SCHEMA_CACHE.stats}")
+
+
+if __name__ == '__main__':
+    files = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    rows = int(sys.argv[2]) if len(sys.argv) > 2 else 50_000
+    run(files, rows)
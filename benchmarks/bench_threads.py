@@ -0,0 +1,42 @@
+"""
+Benchmark de montée en charge de `convert` de 1 à N threads.
+
+Usage : python benchmarks/bench_threads.py [max_threads] [conversions_par_thread]
+"""
+import logging
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from chimere.core import convert, logger  # noqa: E402
+from chimere.types import JSONData, CSVData  # noqa: E402
+
+
+def _worker(n):
+    for i in range(n):
+        convert(JSONData('{"name": "Bob", "age": %d}' % i), CSVData)
+
+
+def run(max_threads, per_thread):
+    logger.setLevel(logging.WARNING)
+    _worker(10)  # Préchauffe le cache de chemins
+    print(f"{'threads':>8} {'total':>8} {'secondes':>10} {'conv/s':>10}")
+    threads = 1
+    while threads <= max_threads:
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=threads) as pool:
+            for future in [pool.submit(_worker, per_thread) for _ in range(threads)]:
+                future.result()
+        elapsed = time.perf_counter() - start
+        total = threads * per_thread
+        print(f"{threads:>8} {total:>8} {elapsed:>10.3f} {total / elapsed:>10.0f}")
+        threads *= 2
+
+
+if __name__ == '__main__':
+    max_threads = int(sys.argv[1]) if len(sys.argv) > 1 else os.cpu_count() or 4
+    per_thread = int(sys.argv[2]) if len(sys.argv) > 2 else 500
+    run(max_threads, per_thread)
@@ -3,5 +3,6 @@ from . import core
 from . import types
 from . import registry
 from . import types_interop
+from .profiling import explain
 
-__all__ = ['adapters', 'core', 'types', 'registry', 'types_interop']
\ No newline at end of file
+__all__ = ['adapters', 'core', 'types', 'registry', 'types_interop', 'explain']
\ No newline at end of file
@@ -1,17 +1,27 @@
 import json
+import os
 import pandas as pd
 import csv
 import io
+from pathlib import Path
 import xml.etree.ElementTree as ET
 import tempfile
 import ctypes
 from typing import Any, Dict
 from .registry import register_adapter
 from .types import (
-    PythonDictData, PandasDataFrameData, CSVData, JSONData, XMLData, ParquetData
+    PythonDictData, PandasDataFrameData, CSVData, JSONData, JSONLinesData, XMLData, ParquetData,
+    stream_position,
 )
 from .metadata import MetadataRegistry
 from .dynamic_types import DynamicStructureFactory, DynamicStructData
+from .packed import PackedStructData, register_packed_adapter
+from .shared import (
+    SharedMemoryData, dataframe_to_shared, shared_to_dataframe, packed_to_shared, shared_packed_view
+)
+from .csv_schema import read_csv
+from .optimizer import apply_chain, register_fusion
+from . import jsonlines
 from .exceptions import ValidationError, ConversionError
 
 # Dynamic adapters
@@ -86,24 +96,76 @@ class DictToDynamicStructAdapter:
         adapter = DictToStructAdapter(f"{self.lib_name}_{self.struct_name}")
         return adapter.convert(dict_obj.data)
 
+def _load_json(json_obj: JSONData) -> Any:
+    """Parse le JSON directement depuis sa source (str, octets, fichier ou flux)."""
+    if not json_obj.is_stream():
+        source = json_obj.source
+        if isinstance(source, memoryview):
+            source = source.tobytes()
+        if isinstance(source, (str, bytes, bytearray)):
+            return json.loads(source)
+    with json_obj.open_source() as f:
+        return json.load(f)
+
+
+def _parse_xml(xml_obj: XMLData) -> ET.Element:
+    """Parse le XML directement depuis sa source (str, octets, fichier ou flux)."""
+    if not xml_obj.is_stream():
+        source = xml_obj.source
+        if isinstance(source, (str, bytes, bytearray)):
+            return ET.fromstring(source)
+    with xml_obj.open_source() as f:
+        return ET.parse(f).getroot()
+
+
+def _is_path(output: Any) -> bool:
+    return isinstance(output, (str, os.PathLike))
+
+
 @register_adapter(JSONData, PythonDictData, cost=2, fidelity='high')
 class JSONToDictAdapter:
     def validate_input(self, json_obj: JSONData):
-        # Vérifier que c'est du JSON valide
+        # Vérifier que c'est du JSON valide ; le résultat est réutilisé par convert
         try:
-            json.loads(json_obj.content)
-        except json.JSONDecodeError:
+            self._parsed = (json_obj, _load_json(json_obj))
+        except ValueError:
             raise ValueError("JSON invalide")
 
+    def estimate_output_size(self, json_obj: JSONData) -> int:
+        # Les objets Python décodés occupent plusieurs fois la taille du texte
+        return 4 * json_obj.size()
+
+    def _load(self, json_obj: JSONData) -> Any:
+        parsed = getattr(self, '_parsed', None)
+        if parsed is not None and parsed[0] is json_obj:
+            return parsed[1]
+        return _load_json(json_obj)
+
     def convert(self, json_obj: JSONData) -> PythonDictData:
-        data = json.loads(json_obj.content)
-        return PythonDictData(data)
+        return PythonDictData(self._load(json_obj))
+
+
+def _dump_json(data: Any, output: Any = None) -> JSONData:
+    if output is None:
+        return JSONData(json.dumps(data))
+    if _is_path(output):
+        with open(output, 'w', encoding='utf-8') as f:
+            json.dump(data, f)
+        return JSONData(Path(output))
+    start = stream_position(output)
+    if isinstance(output, io.TextIOBase):
+        json.dump(data, output)
+    else:
+        output.write(json.dumps(data).encode('utf-8'))
+    return JSONData.written_to(output, start)
 
 
 @register_adapter(PythonDictData, JSONData, cost=1, fidelity='high')
 class DictToJSONAdapter:
-    def convert(self, dict_obj: PythonDictData) -> JSONData:
-        return JSONData(json.dumps(dict_obj.data))
+    supports_output = True
+
+    def convert(self, dict_obj: PythonDictData, output: Any = None) -> JSONData:
+        return _dump_json(dict_obj.data, output)
 
 
 @register_adapter(PythonDictData, PandasDataFrameData, cost=2, fidelity='high')
@@ -129,32 +191,110 @@ class DataFrameToDictAdapter:
 
 @register_adapter(PandasDataFrameData, CSVData, cost=2, fidelity='medium')
 class DataFrameToCSVAdapter:
-    def convert(self, df_obj: PandasDataFrameData) -> CSVData:
-        output = io.StringIO()
+    supports_output = True
+
+    def estimate_output_size(self, df_obj: PandasDataFrameData) -> int:
+        return int(df_obj.df.memory_usage(index=False, deep=True).sum())
+
+    def convert(self, df_obj: PandasDataFrameData, output: Any = None) -> CSVData:
+        if output is None:
+            output_io = io.StringIO()
+            df_obj.df.to_csv(output_io, index=False)
+            return CSVData(output_io.getvalue())
+        # Écriture directe dans le fichier ou le flux cible, sans str intermédiaire
+        start = stream_position(output)
         df_obj.df.to_csv(output, index=False)
-        return CSVData(output.getvalue())
+        return CSVData.written_to(output, start)
 
 
 @register_adapter(CSVData, PandasDataFrameData, cost=2, fidelity='medium')
 class CSVToDataFrameAdapter:
+    def estimate_output_size(self, csv_obj: CSVData) -> int:
+        return 2 * csv_obj.size()
+
     def convert(self, csv_obj: CSVData) -> PandasDataFrameData:
-        input_io = io.StringIO(csv_obj.content)
-        df = pd.read_csv(input_io)
-        return PandasDataFrameData(df)
+        # Types fixés par le schéma explicite ou mis en cache (voir csv_schema)
+        return PandasDataFrameData(read_csv(csv_obj))
+
+
+def _write_lines(records: Any, output: Any) -> None:
+    """Écrit un document JSON par ligne dans un fichier (chemin) ou un flux."""
+    if _is_path(output):
+        with open(output, 'w', encoding='utf-8') as f:
+            _write_lines(records, f)
+        return
+    text = isinstance(output, io.TextIOBase)
+    for record in records:
+        line = json.dumps(record) + '\n'
+        output.write(line if text else line.encode('utf-8'))
+
+
+# Coûts choisis pour qu'aucun chemin existant ne passe par JSONLinesData
+@register_adapter(JSONLinesData, PythonDictData, cost=2, fidelity='high')
+class JSONLinesToDictAdapter:
+    def estimate_output_size(self, jsonl_obj: JSONLinesData) -> int:
+        return 4 * jsonl_obj.size()
+
+    def convert(self, jsonl_obj: JSONLinesData) -> PythonDictData:
+        records, bad_lines = jsonlines.parse(jsonl_obj)
+        return PythonDictData(records, bad_lines=bad_lines)
+
+
+@register_adapter(JSONLinesData, PandasDataFrameData, cost=2, fidelity='high')
+class JSONLinesToDataFrameAdapter:
+    def estimate_output_size(self, jsonl_obj: JSONLinesData) -> int:
+        return 2 * jsonl_obj.size()
+
+    def convert(self, jsonl_obj: JSONLinesData) -> PandasDataFrameData:
+        records, bad_lines = jsonlines.parse(jsonl_obj)
+        return PandasDataFrameData(pd.DataFrame(records), bad_lines=bad_lines)
+
+
+@register_adapter(PythonDictData, JSONLinesData, cost=2, fidelity='high')
+class DictToJSONLinesAdapter:
+    supports_output = True
+
+    def convert(self, dict_obj: PythonDictData, output: Any = None) -> JSONLinesData:
+        # Un dict seul donne un fichier d'une ligne
+        records = dict_obj.data if isinstance(dict_obj.data, list) else [dict_obj.data]
+        if output is None:
+            buffer = io.StringIO()
+            _write_lines(records, buffer)
+            return JSONLinesData(buffer.getvalue())
+        start = stream_position(output)
+        _write_lines(records, output)
+        return JSONLinesData.written_to(output, start)
+
+
+@register_adapter(PandasDataFrameData, JSONLinesData, cost=2, fidelity='medium')
+class DataFrameToJSONLinesAdapter:
+    supports_output = True
+
+    def convert(self, df_obj: PandasDataFrameData, output: Any = None) -> JSONLinesData:
+        if output is None:
+            return JSONLinesData(df_obj.df.to_json(orient='records', lines=True))
+        start = stream_position(output)
+        df_obj.df.to_json(output, orient='records', lines=True)
+        return JSONLinesData.written_to(output, start)
 
 
 @register_adapter(XMLData, PythonDictData, cost=3, fidelity='medium')
 class XMLToDictAdapter:
     def validate_input(self, xml_obj: XMLData):
+        # Le document parsé est réutilisé par convert
         try:
-            ET.fromstring(xml_obj.content)
+            self._parsed = (xml_obj, _parse_xml(xml_obj))
         except ET.ParseError:
             raise ValueError("XML invalide")
 
-    def convert(self, xml_obj: XMLData) -> PythonDictData:
+    def _load(self, xml_obj: XMLData) -> Dict[str, Any]:
         # Conversion simplifiée XML->Dict (juste un exemple)
-        root = ET.fromstring(xml_obj.content)
-        return PythonDictData({root.tag: root.text})
+        parsed = getattr(self, '_parsed', None)
+        root = parsed[1] if parsed is not None and parsed[0] is xml_obj else _parse_xml(xml_obj)
+        return {root.tag: root.text}
+
+    def convert(self, xml_obj: XMLData) -> PythonDictData:
+        return PythonDictData(self._load(xml_obj))
 
 
 @register_adapter(PythonDictData, XMLData, cost=3, fidelity='medium')
@@ -179,7 +319,16 @@ class DictToXMLAdapter:
 
 @register_adapter(PandasDataFrameData, ParquetData, cost=4, fidelity='high')
 class DataFrameToParquetAdapter:
-    def convert(self, df_obj: PandasDataFrameData) -> ParquetData:
+    supports_output = True
+
+    def estimate_output_size(self, df_obj: PandasDataFrameData) -> int:
+        # Le résultat n'est qu'un chemin vers le fichier écrit
+        return 0
+
+    def convert(self, df_obj: PandasDataFrameData, output: Any = None) -> ParquetData:
+        if output is not None:
+            df_obj.df.to_parquet(output)
+            return ParquetData(str(output) if _is_path(output) else output)
         # Sauver le DataFrame en parquet dans un fichier temporaire
         temp = tempfile.NamedTemporaryFile(suffix=".parquet", delete=False)
         df_obj.df.to_parquet(temp.name)
@@ -211,4 +360,150 @@ class ForeignStructToJSONAdapter:
             if isinstance(value, bytes):
                 value = value.decode('utf-8')
             data[field_name] = value
-        return JSONData(json.dumps(data))
\ No newline at end of file
+        return JSONData(json.dumps(data))
+
+# Packed struct adapters
+@register_packed_adapter(PythonDictData, PackedStructData, cost=2, fidelity='medium')
+class DictToPackedStructAdapter:
+    packed_type = PackedStructData
+
+    def convert(self, dict_obj: PythonDictData) -> PackedStructData:
+        records = dict_obj.data if isinstance(dict_obj.data, list) else [dict_obj.data]
+        codec = self.packed_type.codec_for()
+        return self.packed_type(codec.pack(records))
+
+
+@register_packed_adapter(PandasDataFrameData, PackedStructData, cost=2, fidelity='medium')
+class DataFrameToPackedStructAdapter:
+    packed_type = PackedStructData
+
+    def convert(self, df_obj: PandasDataFrameData) -> PackedStructData:
+        df = df_obj.df
+        codec = self.packed_type.codec_for()
+        columns = {name: df[name].to_numpy() for name in df.columns}
+        unknown = set(columns) - set(codec.metadata.fields)
+        if unknown:
+            raise ValidationError(f"Champs inconnus: {unknown}")
+        return self.packed_type(codec.pack_columns(columns, len(df)))
+
+
+@register_packed_adapter(PackedStructData, PythonDictData, cost=2, fidelity='high')
+class PackedStructToDictAdapter:
+    def convert(self, packed_obj: PackedStructData) -> PythonDictData:
+        records = list(packed_obj.records())
+        # Même convention que DataFrameToDictAdapter : un dict si une seule ligne
+        return PythonDictData(records[0] if len(records) == 1 else records)
+
+
+@register_packed_adapter(PackedStructData, PandasDataFrameData, cost=2, fidelity='high')
+class PackedStructToDataFrameAdapter:
+    def convert(self, packed_obj: PackedStructData) -> PandasDataFrameData:
+        return PandasDataFrameData(pd.DataFrame(packed_obj.columns()))
+
+
+# On ne doit pas choisir implicitement un schéma en passant par une sous-classe
+# packed : l'adaptateur n'est utilisé que depuis un objet packed fourni par
+# l'appelant (first_hop_only, y compris pour les routes de repli). Le coût
+# reste supérieur aux routes existantes vers DynamicStructData.
+@register_packed_adapter(PackedStructData, DynamicStructData, cost=6, fidelity='high')
+class PackedStructToDynamicStructAdapter:
+    first_hop_only = True
+
+    def convert(self, packed_obj: PackedStructData) -> DynamicStructData:
+        if packed_obj.count != 1:
+            raise ValidationError(
+                f"Un seul enregistrement attendu pour DynamicStructData, reçu {packed_obj.count}"
+            )
+        array = packed_obj.as_ctypes()
+        return DynamicStructData(ctypes.pointer(array[0]), packed_obj.metadata, owner=packed_obj)
+
+
+@register_adapter(DynamicStructData, PackedStructData, cost=2, fidelity='high')
+class DynamicStructToPackedStructAdapter:
+    def convert(self, struct_obj: DynamicStructData) -> PackedStructData:
+        contents = struct_obj.ptr.contents
+        record = {name: getattr(contents, name) for name in struct_obj.metadata.fields}
+        codec = PackedStructData.codec_for(struct_obj.metadata)
+        return PackedStructData(codec.pack([record]), struct_obj.metadata)
+
+# Shared memory adapters
+@register_adapter(PandasDataFrameData, SharedMemoryData, cost=3, fidelity='high')
+class DataFrameToSharedMemoryAdapter:
+    def convert(self, df_obj: PandasDataFrameData) -> SharedMemoryData:
+        return dataframe_to_shared(df_obj.df)
+
+
+@register_adapter(SharedMemoryData, PandasDataFrameData, cost=2, fidelity='high')
+class SharedMemoryToDataFrameAdapter:
+    def convert(self, shared_obj: SharedMemoryData) -> PandasDataFrameData:
+        df_obj = PandasDataFrameData(shared_to_dataframe(shared_obj))
+        # Les colonnes numériques sont des vues sur le segment : on le garde ouvert
+        df_obj.shared = shared_obj
+        return df_obj
+
+
+@register_packed_adapter(PackedStructData, SharedMemoryData, cost=2, fidelity='high')
+class PackedStructToSharedMemoryAdapter:
+    def convert(self, packed_obj: PackedStructData) -> SharedMemoryData:
+        return packed_to_shared(packed_obj.tobytes(), packed_obj.metadata.name, packed_obj.metadata.version)
+
+
+@register_packed_adapter(SharedMemoryData, PackedStructData, cost=2, fidelity='high')
+class SharedMemoryToPackedStructAdapter:
+    packed_type = PackedStructData
+
+    def convert(self, shared_obj: SharedMemoryData) -> PackedStructData:
+        # Vue en lecture seule : as_ctypes relocalise une copie privée plutôt
+        # que d'écrire des adresses de ce processus dans le segment partagé
+        view = shared_packed_view(shared_obj, self.packed_type.metadata.name).toreadonly()
+        packed_obj = self.packed_type(view)
+        packed_obj.shared = shared_obj
+        return packed_obj
+
+
+# Fusions : implémentations directes de suites d'adaptateurs fréquentes
+# (même résultat que la suite, sans construire les intermédiaires)
+@register_fusion(JSONToDictAdapter, DictToDataFrameAdapter)
+class JSONToDataFrameFusion(JSONToDictAdapter):
+    def convert(self, json_obj: JSONData) -> PandasDataFrameData:
+        return PandasDataFrameData(pd.DataFrame([self._load(json_obj)]))
+
+
+def _is_flat_record(data: Any) -> bool:
+    """Dict non vide sans NaN (que pandas écrirait comme une cellule vide)."""
+    return isinstance(data, dict) and bool(data) and not any(
+        isinstance(value, float) and value != value for value in data.values()
+    )
+
+
+@register_fusion(JSONToDictAdapter, DictToDataFrameAdapter, DataFrameToCSVAdapter)
+class JSONToCSVFusion(JSONToDictAdapter):
+    supports_output = True
+
+    def convert(self, json_obj: JSONData, output: Any = None) -> CSVData:
+        data = self._load(json_obj)
+        if not _is_flat_record(data):
+            return apply_chain((DictToDataFrameAdapter, DataFrameToCSVAdapter), PythonDictData(data), output)
+        # Une ligne : écrite par le module csv, au format de DataFrame.to_csv
+        buffer = io.StringIO()
+        writer = csv.writer(buffer, lineterminator=os.linesep)
+        writer.writerow(data.keys())
+        writer.writerow(data.values())
+        text = buffer.getvalue()
+        if output is None:
+            return CSVData(text)
+        if _is_path(output):
+            with open(output, 'w', encoding='utf-8', newline='') as f:
+                f.write(text)
+            return CSVData(Path(output))
+        start = stream_position(output)
+        output.write(text if isinstance(output, io.TextIOBase) else text.encode('utf-8'))
+        return CSVData.written_to(output, start)
+
+
+@register_fusion(XMLToDictAdapter, DictToJSONAdapter)
+class XMLToJSONFusion(XMLToDictAdapter):
+    supports_output = True
+
+    def convert(self, xml_obj: XMLData, output: Any = None) -> JSONData:
+        return _dump_json(self._load(xml_obj), output)
@@ -0,0 +1,184 @@
+# chimere/aio.py
+"""API asyncio de conversion : exécuteurs bornés, délais et annulation."""
+import asyncio
+import inspect
+import weakref
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
+from typing import Any, Iterable, List, Optional
+
+from .core import DEFAULT_ALTERNATIVES, _resolve_routes, _RoutePlan, _write_output, get_snapshot, logger
+from .singleflight import SINGLE_FLIGHT, flight_key, output_key
+
+
+class _Settings:
+    executor: Optional[Executor] = None
+    max_concurrency: Optional[int] = None
+
+
+# Un sémaphore par boucle d'événements (asyncio.Semaphore est lié à sa boucle)
+_SEMAPHORES: 'weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]' = weakref.WeakKeyDictionary()
+
+
+def configure(executor: Optional[Executor] = None, max_concurrency: Optional[int] = None) -> None:
+    """
+    Configure l'exécution asynchrone.
+    executor: exécuteur des adaptateurs bloquants (ThreadPoolExecutor ou
+              ProcessPoolExecutor ; l'exécuteur par défaut de la boucle si None)
+    max_concurrency: nombre maximal de conversions simultanées (illimité si None)
+    """
+    _Settings.executor = executor
+    _Settings.max_concurrency = max_concurrency
+    _SEMAPHORES.clear()
+
+
+def _semaphore() -> Optional[asyncio.Semaphore]:
+    if _Settings.max_concurrency is None:
+        return None
+    loop = asyncio.get_running_loop()
+    semaphore = _SEMAPHORES.get(loop)
+    if semaphore is None:
+        semaphore = _SEMAPHORES[loop] = asyncio.Semaphore(_Settings.max_concurrency)
+    return semaphore
+
+
+def _apply_adapter(adapter_cls: type, validation_func: Any, obj: Any, output: Any = None) -> Any:
+    """Exécute un adaptateur bloquant (fonction de module : transmissible à un processus)."""
+    adapter = adapter_cls()
+    if validation_func is not None:
+        validation_func(adapter, obj)
+    if output is not None:
+        return adapter.convert(obj, output=output)
+    return adapter.convert(obj)
+
+
+async def _apply_async(adapter_info, obj, output=None):
+    adapter_cls = adapter_info['class']
+    validation_func = adapter_info['pre_validation']
+    if not getattr(adapter_cls, 'supports_output', False):
+        output = None
+    if inspect.iscoroutinefunction(adapter_cls.convert):
+        # Adaptateur natif async (ex. lecture I/O) : exécuté dans la boucle
+        adapter = adapter_cls()
+        if validation_func is not None:
+            validation_func(adapter, obj)
+        if output is not None:
+            return await adapter.convert(obj, output=output)
+        return await adapter.convert(obj)
+
+    executor = _Settings.executor
+    if isinstance(executor, ProcessPoolExecutor):
+        # Les fonctions de validation sont des méthodes de la classe : on les
+        # retrouve dans le processus fils plutôt que de les transmettre.
+        validation_func = getattr(adapter_cls, 'validate_input', None)
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(executor, _apply_adapter, adapter_cls, validation_func, obj, output)
+
+
+async def _convert(obj, target_type, constraints, alternatives, output, optimize):
+    from_type = type(obj)
+    if isinstance(obj, target_type):
+        return obj if output is None else _write_output(obj, output)
+    snapshot = get_snapshot()
+    logger.debug(f"Attempting to convert {from_type.__name__} to {target_type.__name__} (async)")
+    routes = _resolve_routes(from_type, target_type, alternatives, constraints, snapshot)
+    if not routes:
+        raise ValueError(f"Aucun chemin de conversion trouvé entre {from_type.__name__} et {target_type.__name__}")
+
+    plan = _RoutePlan(snapshot, routes, optimize)
+    current_obj = obj
+    while not plan.done():
+        end, adapter_info = plan.next_step()
+        # Chaque étape est un point d'annulation : une tâche annulée ou hors
+        # délai ne démarre pas l'étape suivante.
+        try:
+            plan.start(end, adapter_info)
+            hop_output = output if plan.is_last(end) else None
+            current_obj = await _apply_async(adapter_info, current_obj, hop_output)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            plan.fail(end, adapter_info, e)
+            continue
+        plan.advance(end, adapter_info)
+    return plan.finish(current_obj, output)
+
+
+async def _convert_bounded(obj, target_type, timeout, constraints, alternatives, output, optimize):
+    semaphore = _semaphore()
+    if semaphore is None:
+        return await asyncio.wait_for(_convert(obj, target_type, constraints, alternatives, output, optimize), timeout)
+    async with semaphore:
+        return await asyncio.wait_for(_convert(obj, target_type, constraints, alternatives, output, optimize), timeout)
+
+
+# Tâche de chaque exécution partagée lancée depuis l'API asyncio
+_SHARED_TASKS: 'weakref.WeakKeyDictionary[Future, asyncio.Future]' = weakref.WeakKeyDictionary()
+
+
+async def _run_shared(key, future, obj, target_type, constraints, alternatives, output, optimize):
+    """Exécute une conversion coalescée et publie son résultat à tous les appelants."""
+    try:
+        result = await _convert_bounded(obj, target_type, None, constraints, alternatives, output, optimize)
+    except asyncio.CancelledError:
+        SINGLE_FLIGHT.release(key, future, cancelled=True)
+        raise
+    except Exception as e:
+        # L'erreur est transmise par future ; la tâche elle-même se termine sans erreur
+        SINGLE_FLIGHT.release(key, future, error=e)
+        return
+    except BaseException as e:
+        SINGLE_FLIGHT.release(key, future, error=e)
+        raise
+    # Même forme que les exécutions partagées synchrones (chimere.core.convert)
+    SINGLE_FLIGHT.release(key, future, (result, None))
+
+
+async def convert_async(obj, target_type, timeout: Optional[float] = None, constraints=None,
+                        alternatives=DEFAULT_ALTERNATIVES, output=None, optimize=True, coalesce=False):
+    """
+    Équivalent asynchrone de chimere.core.convert.
+    Les adaptateurs bloquants s'exécutent sur l'exécuteur configuré, les
+    adaptateurs dont convert est une coroutine sont attendus directement.
+    timeout: délai maximal en secondes (asyncio.TimeoutError au-delà)
+    output: chemin ou flux cible du résultat (voir chimere.core.convert)
+    optimize: applique les fusions d'étapes enregistrées (chimere.optimizer)
+    coalesce: partage une exécution en cours identique, y compris avec les
+              appels synchrones d'autres threads (voir chimere.core.convert) ;
+              timeout et annulation ne concernent que l'appelant, l'exécution
+              partagée n'est abandonnée que si plus personne ne l'attend
+    """
+    if not coalesce or isinstance(obj, target_type):
+        return await _convert_bounded(obj, target_type, timeout, constraints, alternatives, output, optimize)
+
+    key = flight_key(obj, coalesce, target_type, constraints, alternatives, optimize, output_key(output))
+    future, leader = SINGLE_FLIGHT.acquire(key)
+    if leader:
+        # L'exécution partagée est une tâche distincte, sans le délai de l'appelant
+        _SHARED_TASKS[future] = asyncio.ensure_future(
+            _run_shared(key, future, obj, target_type, constraints, alternatives, output, optimize)
+        )
+    try:
+        # shield : le délai ou l'annulation d'un appelant n'annule pas l'exécution partagée
+        result, _ = await asyncio.wait_for(asyncio.shield(asyncio.wrap_future(future)), timeout)
+        return result
+    finally:
+        if SINGLE_FLIGHT.leave(key, future):
+            # Plus aucun appelant n'attend : l'exécution encore en cours est abandonnée
+            task = _SHARED_TASKS.pop(future, None)
+            if task is not None and not task.done():
+                task.get_loop().call_soon_threadsafe(task.cancel)
+
+
+async def convert_many(objs: Iterable[Any], target_type, timeout: Optional[float] = None,
+                       constraints=None, alternatives=DEFAULT_ALTERNATIVES,
+                       return_exceptions: bool = False, coalesce=False) -> List[Any]:
+    """
+    Convertit plusieurs objets en parallèle (dans la limite de max_concurrency).
+    Les résultats sont renvoyés dans l'ordre des entrées ; timeout s'applique
+    à chaque conversion ; avec coalesce, les entrées identiques ne sont
+    converties qu'une fois.
+    """
+    return await asyncio.gather(
+        *(convert_async(obj, target_type, timeout, constraints, alternatives, coalesce=coalesce) for obj in objs),
+        return_exceptions=return_exceptions,
+    )
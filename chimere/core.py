@@ -1,6 +1,18 @@
+import asyncio
+import heapq
+import inspect
 import logging
-from collections import deque
-from .registry import ADAPTERS
+import threading
+from contextlib import nullcontext
+from dataclasses import dataclass
+from typing import FrozenSet, Optional
+from .exceptions import ConversionError, ValidationError
+from .registry import add_listener, get_snapshot
+from .optimizer import match_fusion, remove_round_trips
+from .singleflight import SINGLE_FLIGHT, flight_key, output_key
+from .memory import (
+    HopMemory, MemoryReport, SpillStore, estimate_output_size, estimate_size, traced_memory
+)
 from itertools import count
 
 logger = logging.getLogger(__name__)
@@ -11,86 +23,686 @@ ch = logging.StreamHandler()
 ch.setLevel(logging.DEBUG)
 logger.addHandler(ch)
 
-# Cache pour les chemins trouvés : cache[type_source, type_cible] = (cost, path)
+# Cache des routes, indexé par version du registre :
+# cache[version][type_source] = _RouteTree (plus courts chemins depuis la source)
+# Chaque arbre dépend des arêtes qui le composent (routes trouvées) et de
+# l'ensemble des types atteints (routes absentes). Lorsqu'un adaptateur est
+# enregistré, seuls les arbres concernés sont mis à jour de façon incrémentale ;
+# les autres sont repris tels quels dans la nouvelle version.
 PATH_CACHE = {}
-COUNTER = count()
+# Routes alternatives (k meilleures sous contraintes) :
+# cache[version][source, cible, k, contraintes] = ((cost, path), ...)
+# Comme les arbres, les entrées dont la source n'atteint aucune arête
+# modifiée sont reprises dans la nouvelle version (idem pour DISPATCH_CACHE).
+ALTERNATIVES_CACHE = {}
+# Résolution par sous-type (comme functools.singledispatch), par version :
+# cache[version][type concret, cible, contraintes] = (source, cible) du graphe, ou None
+DISPATCH_CACHE = {}
+_CACHE_LOCK = threading.Lock()
 
-def find_conversion_path(start_type, target_type):
+# Nombre de routes précalculées par convert pour le repli en cas d'échec
+DEFAULT_ALTERNATIVES = 3
+FIDELITY_LEVELS = {'low': 0, 'medium': 1, 'high': 2}
+# Échecs d'adaptateur qui justifient un repli sur une autre route ; les autres
+# exceptions (TypeError, AttributeError...) sont des erreurs de programmation
+FALLBACK_ERRORS = (ValueError, ValidationError, ConversionError)
+
+
+@dataclass(frozen=True)
+class RouteConstraints:
+    """
+    Contraintes sur les routes de conversion.
+    min_fidelity: fidélité minimale de chaque adaptateur ('low', 'medium', 'high')
+    max_hops: nombre maximal d'adaptateurs enchaînés
+    exclude: classes d'adaptateurs à ne pas utiliser
+    lossier_fallback: autorise le repli sur des routes moins fidèles que la
+    route principale (par défaut, le repli conserve au moins sa fidélité)
+    """
+    min_fidelity: Optional[str] = None
+    max_hops: Optional[int] = None
+    exclude: FrozenSet[type] = frozenset()
+    lossier_fallback: bool = False
+
+    def __post_init__(self):
+        if self.min_fidelity is not None and self.min_fidelity not in FIDELITY_LEVELS:
+            raise ValueError(f"Fidélité inconnue: {self.min_fidelity}")
+        object.__setattr__(self, 'exclude', frozenset(self.exclude))
+
+    def allows(self, adapter_info):
+        if adapter_info['class'] in self.exclude:
+            return False
+        if self.min_fidelity is not None:
+            level = FIDELITY_LEVELS.get(adapter_info['fidelity'], 0)
+            return level >= FIDELITY_LEVELS[self.min_fidelity]
+        return True
+
+
+class _RouteTree:
+    """
+    Arbre des plus courts chemins depuis une source.
+    Immuable une fois publié dans PATH_CACHE : une mise à jour produit une copie.
+    """
+    __slots__ = ('source', 'dist', 'parent')
+
+    def __init__(self, source, dist=None, parent=None):
+        self.source = source
+        self.dist = dist if dist is not None else {source: 0}
+        self.parent = parent if parent is not None else {source: None}
+
+    @classmethod
+    def build(cls, snapshot, source):
+        tree = cls(source)
+        tree._relax(snapshot, [(0, 0, source)])
+        return tree
+
+    def _relax(self, snapshot, heap, allowed=None):
+        """
+        Dijkstra à partir des entrées du tas ; allowed restreint les types dont
+        la distance peut encore changer (None : aucune restriction).
+        """
+        tiebreaker = count(len(heap))
+        heapq.heapify(heap)
+        settled = set()
+        while heap:
+            cost, _, node = heapq.heappop(heap)
+            if node in settled or cost > self.dist.get(node, float('inf')):
+                continue
+            settled.add(node)
+            for t, adapter_info in snapshot.successors.get(node, ()):
+                if allowed is not None and t not in allowed:
+                    continue
+                new_cost = cost + adapter_info['cost']
+                if new_cost < self.dist.get(t, float('inf')):
+                    self.dist[t] = new_cost
+                    self.parent[t] = node
+                    heapq.heappush(heap, (new_cost, next(tiebreaker), t))
+
+    def _copy(self):
+        return _RouteTree(self.source, dict(self.dist), dict(self.parent))
+
+    def _subtree(self, root):
+        """Types dont le chemin le plus court passe par root (root inclus)."""
+        nodes = {root}
+        changed = True
+        while changed:
+            changed = False
+            for node, parent in self.parent.items():
+                if parent in nodes and node not in nodes:
+                    nodes.add(node)
+                    changed = True
+        return nodes
+
+    def updated(self, snapshot, delta):
+        """Retourne l'arbre à jour pour snapshot (self s'il n'est pas affecté)."""
+        tree = self
+        for f, t, old_info, new_info in delta:
+            if f not in tree.dist:
+                # Arête hors de la zone atteinte : ni les routes trouvées ni
+                # les routes absentes ne peuvent en dépendre.
+                continue
+            new_cost = new_info['cost']
+            if old_info is None or new_cost < old_info['cost']:
+                # Ajout ou baisse de coût : propagation des distances améliorées
+                candidate = tree.dist[f] + new_cost
+                if candidate < tree.dist.get(t, float('inf')):
+                    if tree is self:
+                        tree = tree._copy()
+                    tree.dist[t] = candidate
+                    tree.parent[t] = f
+                    tree._relax(snapshot, [(candidate, 0, t)])
+            elif new_cost > old_info['cost'] and tree.parent.get(t) == f:
+                # Hausse de coût d'une arête utilisée : on recalcule le
+                # sous-arbre qui en dépend à partir de ses autres prédécesseurs.
+                if tree is self:
+                    tree = tree._copy()
+                affected = tree._subtree(t)
+                for node in affected:
+                    del tree.dist[node]
+                    del tree.parent[node]
+                heap = []
+                for node in affected:
+                    for p, info in snapshot.predecessors.get(node, ()):
+                        if p in tree.dist and p not in affected:
+                            candidate = tree.dist[p] + info['cost']
+                            if candidate < tree.dist.get(node, float('inf')):
+                                tree.dist[node] = candidate
+                                tree.parent[node] = p
+                for node in affected:
+                    if node in tree.dist:
+                        heap.append((tree.dist[node], len(heap), node))
+                tree._relax(snapshot, heap, allowed=affected)
+        return tree
+
+    def route_to(self, target):
+        """Retourne (cost, path) vers target, ou (None, None)."""
+        if target not in self.dist:
+            return (None, None)
+        path = [target]
+        while path[-1] != self.source:
+            path.append(self.parent[path[-1]])
+        path.reverse()
+        return (self.dist[target], path)
+
+
+def _path_cache_for(snapshot, store=None):
+    """Retourne le cache (PATH_CACHE par défaut) associé à la version du snapshot."""
+    if store is None:
+        store = PATH_CACHE
+    cache = store.get(snapshot.version)
+    if cache is not None:
+        return cache
+    with _CACHE_LOCK:
+        cache = store.setdefault(snapshot.version, {})
+        for version in [v for v in store if v < snapshot.version]:
+            del store[version]
+    return cache
+
+
+def _carry_over(store, old, new, sources_of, reachable):
+    """
+    Reporte dans la nouvelle version les entrées de store dont aucune source
+    n'atteint une arête modifiée (même test que _RouteTree.updated).
+    """
+    old_cache = store.get(old.version)
+    if not old_cache:
+        return
+    changed = {f for f, _, _, _ in new.delta}
+    new_cache = {
+        key: value for key, value in old_cache.copy().items()
+        if not any(changed & reachable(source) for source in sources_of(key))
+    }
+    with _CACHE_LOCK:
+        store[new.version] = new_cache
+        for version in [v for v in store if v < new.version]:
+            del store[version]
+
+
+@add_listener
+def _on_registry_update(old, new):
+    """Reporte le cache de l'ancienne version en ne mettant à jour que les arbres affectés."""
+    old_cache = PATH_CACHE.get(old.version)
+    new_cache = {}
+    if old_cache:
+        try:
+            new_cache = {
+                source: tree.updated(new, new.delta)
+                for source, tree in old_cache.copy().items()
+            }
+        except Exception:
+            logger.exception("Mise à jour incrémentale des routes impossible, cache réinitialisé")
+            new_cache = {}
+        else:
+            with _CACHE_LOCK:
+                PATH_CACHE[new.version] = new_cache
+                for version in [v for v in PATH_CACHE if v < new.version]:
+                    del PATH_CACHE[version]
+
+    # Types atteints depuis une source dans la nouvelle version (arbres
+    # réutilisés quand ils existent, calculés une fois par source sinon)
+    reached = {}
+
+    def reachable(source):
+        if source not in reached:
+            tree = new_cache.get(source) or _RouteTree.build(new, source)
+            reached[source] = tree.dist.keys()
+        return reached[source]
+
+    _carry_over(ALTERNATIVES_CACHE, old, new, lambda key: (key[0],), reachable)
+    # Le dispatch dépend de toutes les classes de la MRO du type concret
+    _carry_over(DISPATCH_CACHE, old, new, lambda key: key[0].__mro__, reachable)
+
+
+def find_conversion_path(start_type, target_type, snapshot=None):
     """
     Trouve le chemin de conversion le moins coûteux.
-    On utilise un algorithme de type Dijkstra simplifié avec un min-heap.
-    Pour éviter le problème de comparaison de classes, on ajoute un compteur
-    comme tiebreaker.
+    On calcule (une fois par source) l'arbre des plus courts chemins avec un
+    Dijkstra sur min-heap ; un compteur sert de tiebreaker pour éviter de
+    comparer des classes.
+    snapshot: snapshot du registre à utiliser (le snapshot courant par défaut)
     """
     if start_type == target_type:
         return (0, [start_type])
 
-    if (start_type, target_type) in PATH_CACHE:
-        return PATH_CACHE[(start_type, target_type)]
-
-    import heapq
-    heap = []
-    # On push un tuple : (cost, tiebreaker, path)
-    heapq.heappush(heap, (0, next(COUNTER), [start_type]))
-    visited = set()
+    if snapshot is None:
+        snapshot = get_snapshot()
+    cache = _path_cache_for(snapshot)
+    tree = cache.get(start_type)
+    if tree is None:
+        tree = _RouteTree.build(snapshot, start_type)
+        cache[start_type] = tree
+    return tree.route_to(target_type)
 
-    best_path = None
-    best_cost = float('inf')
 
+def _shortest_route(snapshot, start_type, target_type, constraints, banned_edges=(), banned_types=(), max_hops=None):
+    """
+    Plus court chemin simple sous contraintes (Dijkstra sur les chemins, comme
+    la recherche d'origine). Retourne (cost, path) ou None.
+    """
+    tiebreaker = count()
+    heap = [(0, next(tiebreaker), [start_type])]
+    visited = set()
     while heap:
         cost, _, path = heapq.heappop(heap)
         last_type = path[-1]
-
         if last_type == target_type:
-            best_path = path
-            best_cost = cost
+            return (cost, path)
+        # Avec une limite de sauts, un type peut être revisité par un chemin plus court en sauts
+        state = last_type if max_hops is None else (last_type, len(path))
+        if state in visited:
+            continue
+        visited.add(state)
+        if max_hops is not None and len(path) > max_hops:
+            continue
+        for t, adapter_info in snapshot.successors.get(last_type, ()):
+            if t in path or t in banned_types or (last_type, t) in banned_edges:
+                continue
+            if constraints is not None and not constraints.allows(adapter_info):
+                continue
+            heapq.heappush(heap, (cost + adapter_info['cost'], next(tiebreaker), path + [t]))
+    return None
+
+
+def _route_cost(snapshot, path):
+    return sum(snapshot.adapters[(path[i], path[i+1])]['cost'] for i in range(len(path)-1))
+
+
+def find_conversion_paths(start_type, target_type, k=DEFAULT_ALTERNATIVES, constraints=None, snapshot=None):
+    """
+    Trouve les k meilleurs chemins simples (algorithme de Yen), triés par coût.
+    constraints: RouteConstraints optionnelles (fidélité minimale, nombre
+    maximal de sauts, adaptateurs exclus).
+    Retourne une liste de (cost, path), vide si aucun chemin n'existe.
+    """
+    if start_type == target_type:
+        return [(0, [start_type])]
+    if snapshot is None:
+        snapshot = get_snapshot()
+    if k == 1 and constraints is None:
+        cost, path = find_conversion_path(start_type, target_type, snapshot)
+        return [] if path is None else [(cost, path)]
+
+    cache = _path_cache_for(snapshot, ALTERNATIVES_CACHE)
+    key = (start_type, target_type, k, constraints)
+    cached = cache.get(key)
+    if cached is not None:
+        return [(cost, list(path)) for cost, path in cached]
+
+    max_hops = constraints.max_hops if constraints is not None else None
+    first = _shortest_route(snapshot, start_type, target_type, constraints, max_hops=max_hops)
+    routes = [] if first is None else [first]
+    candidates = []
+    tiebreaker = count()
+    while routes and len(routes) < k:
+        previous = routes[-1][1]
+        for i in range(len(previous) - 1):
+            spur_type = previous[i]
+            root = previous[:i+1]
+            banned_edges = {(path[i], path[i+1]) for _, path in routes if path[:i+1] == root}
+            spur = _shortest_route(
+                snapshot, spur_type, target_type, constraints,
+                banned_edges=banned_edges, banned_types=set(root[:-1]),
+                max_hops=None if max_hops is None else max_hops - i,
+            )
+            if spur is None:
+                continue
+            path = root + spur[1][1:]
+            if any(path == p for _, p in routes) or any(path == p for _, _, p in candidates):
+                continue
+            heapq.heappush(candidates, (_route_cost(snapshot, path), next(tiebreaker), path))
+        if not candidates:
             break
+        cost, _, path = heapq.heappop(candidates)
+        routes.append((cost, path))
+
+    cache[key] = tuple((cost, tuple(path)) for cost, path in routes)
+    return routes
+
+
+def _route_exists(snapshot, start_type, target_type, constraints):
+    if constraints is None:
+        return find_conversion_path(start_type, target_type, snapshot)[1] is not None
+    return bool(find_conversion_paths(start_type, target_type, 1, constraints, snapshot))
+
 
-        if last_type in visited:
+def _dispatch(snapshot, from_type, target_type, constraints=None):
+    targets = [target_type] + [
+        t for t in snapshot.predecessors if t is not target_type and issubclass(t, target_type)
+    ]
+    for source in from_type.__mro__:
+        # Seules les classes ayant des adaptateurs sortants sont explorées :
+        # aucune route (même absente) n'est calculée pour les autres.
+        if source not in snapshot.successors:
             continue
-        visited.add(last_type)
+        if _route_exists(snapshot, source, target_type, constraints):
+            return source, target_type
+        reachable = []
+        for target in targets[1:]:
+            if _route_exists(snapshot, source, target, constraints):
+                cost = find_conversion_paths(source, target, 1, constraints, snapshot)[0][0]
+                reachable.append((cost, target))
+        if reachable:
+            reachable.sort(key=lambda item: item[0])
+            if len(reachable) > 1 and reachable[0][0] == reachable[1][0]:
+                names = ', '.join(t.__name__ for c, t in reachable if c == reachable[0][0])
+                raise ValueError(f"Conversion ambiguë de {from_type.__name__} vers {target_type.__name__}: {names}")
+            return source, reachable[0][1]
+    return None
+
+
+def resolve_dispatch(from_type, target_type, constraints=None, snapshot=None):
+    """
+    Types du graphe à utiliser pour convertir une instance de from_type en
+    target_type, comme functools.singledispatch : la MRO de from_type est
+    parcourue jusqu'à la première classe ayant une route ; la cible est
+    target_type ou, à défaut, le moins coûteux de ses sous-types enregistrés.
+    Le résultat est mis en cache par type concret (et version du registre).
+    Retourne (source, cible) ou None.
+    """
+    if snapshot is None:
+        snapshot = get_snapshot()
+    cache = _path_cache_for(snapshot, DISPATCH_CACHE)
+    key = (from_type, target_type, constraints)
+    try:
+        return cache[key]
+    except KeyError:
+        pass
+    resolved = _dispatch(snapshot, from_type, target_type, constraints)
+    cache[key] = resolved
+    return resolved
+
+
+def _resolve_routes(from_type, target_type, alternatives, constraints, snapshot):
+    """Routes précalculées pour from_type (ou la classe de base résolue) vers target_type."""
+    resolved = resolve_dispatch(from_type, target_type, constraints, snapshot)
+    if resolved is None:
+        raise ValueError(f"Aucun chemin de conversion trouvé entre {from_type.__name__} et {target_type.__name__}")
+    if resolved != (from_type, target_type):
+        logger.debug(f"Dispatch {from_type.__name__} -> {target_type.__name__} "
+                     f"via {resolved[0].__name__} -> {resolved[1].__name__}")
+    routes = find_conversion_paths(resolved[0], resolved[1], alternatives, constraints, snapshot)
+    routes = [route for route in routes if not _implicit_first_hop(snapshot, route[1])]
+    if len(routes) > 1 and not (constraints is not None and constraints.lossier_fallback):
+        floor = _route_fidelity(snapshot, routes[0][1])
+        routes = routes[:1] + [route for route in routes[1:] if _route_fidelity(snapshot, route[1]) >= floor]
+    return routes
+
+
+def _implicit_first_hop(snapshot, path):
+    """
+    Vrai si path emprunte après son départ un adaptateur réservé au premier
+    saut (attribut first_hop_only : la source doit être fournie par l'appelant).
+    """
+    return any(
+        getattr(snapshot.get((path[i], path[i+1]))['class'], 'first_hop_only', False)
+        for i in range(1, len(path) - 1)
+    )
+
+
+def _route_fidelity(snapshot, path):
+    """Niveau de fidélité (FIDELITY_LEVELS) de l'étape la moins fidèle de path."""
+    return min(
+        (FIDELITY_LEVELS.get(snapshot.get((path[i], path[i+1]))['fidelity'], 0) for i in range(len(path) - 1)),
+        default=FIDELITY_LEVELS['high'],
+    )
+
+
+def _apply(adapter_info, obj, output=None):
+    """Applique l'adaptateur (ou la fusion) décrit par adapter_info à obj."""
+    adapter_cls = adapter_info['class']
+    validation_func = adapter_info['pre_validation']
+    adapter = adapter_cls()
+    # Validation
+    if validation_func is not None:
+        validation_func(adapter, obj)
+
+    if output is not None and getattr(adapter, 'supports_output', False):
+        result = adapter.convert(obj, output=output)
+    else:
+        result = adapter.convert(obj)
+    if inspect.isawaitable(result):
+        # Adaptateur natif async utilisé depuis l'API synchrone
+        result = asyncio.run(result)
+    return result
+
+
+def _next_step(snapshot, path, i, optimize=True, disabled=()):
+    """
+    Étape à exécuter depuis path[i] : (indice d'arrivée, info de l'adaptateur),
+    la fusion enregistrée la plus longue si optimize est vrai.
+    """
+    if optimize:
+        fusion = match_fusion(snapshot, path, i, disabled)
+        if fusion is not None:
+            return fusion
+    return i + 1, snapshot.get((path[i], path[i+1]))
+
+
+def _fallback_route(routes, current_type, failed_edges):
+    """
+    Suite de la meilleure route précalculée qui passe par current_type sans
+    emprunter d'arête en échec, ou None.
+    """
+    for _, path in routes:
+        if current_type not in path:
+            continue
+        suffix = path[path.index(current_type):]
+        if not any((suffix[j], suffix[j+1]) in failed_edges for j in range(len(suffix)-1)):
+            return suffix
+    return None
 
-        for (f, t), adapter_info in ADAPTERS.items():
-            if f == last_type:
-                new_cost = cost + adapter_info['cost']
-                if new_cost < best_cost:
-                    new_path = path + [t]
-                    # Ajout du tiebreaker ici aussi
-                    heapq.heappush(heap, (new_cost, next(COUNTER), new_path))
 
-    if best_path is None:
-        PATH_CACHE[(start_type, target_type)] = (None, None)
-        return (None, None)
+def _write_output(result, output):
+    """Écrit un résultat produit en mémoire vers la cible demandée."""
+    if not hasattr(result, 'write_to'):
+        raise ValueError(f"{type(result).__name__} ne peut pas être écrit vers une cible de sortie")
+    result.write_to(output)
+    return result
 
-    PATH_CACHE[(start_type, target_type)] = (best_cost, best_path)
-    return (best_cost, best_path)
+
+class _RoutePlan:
+    """
+    Parcours d'une route, commun aux exécutions synchrone (_execute) et
+    asynchrone (chimere.aio) : étape suivante (fusion comprise), repli sur les
+    étapes non fusionnées ou sur la route précalculée suivante, écriture du
+    résultat final vers output.
+    """
+
+    def __init__(self, snapshot, routes, optimize=True):
+        self.snapshot = snapshot
+        self.routes = routes
+        self.optimize = optimize
+        self.path = list(routes[0][1])
+        if optimize:
+            self.path = remove_round_trips(snapshot, self.path)
+        self.failed_edges = set()
+        self.failed_fusions = set()
+        self.first_error = None
+        self.last_adapter = None
+        self.i = 0
+
+    def done(self):
+        return self.i >= len(self.path) - 1
+
+    def next_step(self):
+        """(indice d'arrivée, info de l'adaptateur ou None) de l'étape courante."""
+        return _next_step(self.snapshot, self.path, self.i, self.optimize, self.failed_fusions)
+
+    def is_last(self, end):
+        return end == len(self.path) - 1
+
+    def start(self, end, adapter_info):
+        """Vérifie l'étape path[i] -> path[end] avant son exécution."""
+        f_type, t_type = self.path[self.i], self.path[end]
+        if adapter_info is None:
+            raise ValueError(f"Aucun adaptateur direct trouvé pour {f_type.__name__} -> {t_type.__name__}")
+        logger.debug(f"Using adapter {adapter_info['class'].__name__} ({f_type.__name__} -> {t_type.__name__})")
+
+    def fail(self, end, adapter_info, error):
+        """
+        Repli après l'échec de l'étape : une fusion est réessayée étape par
+        étape, sinon la suite de la route précalculée suivante remplace le
+        reste du chemin (seulement pour FALLBACK_ERRORS, les autres erreurs
+        sont relevées telles quelles). Relève la première erreur s'il n'y a
+        plus de route.
+        """
+        f_type = self.path[self.i]
+        adapter_name = adapter_info['class'].__name__ if adapter_info else '?'
+        if end > self.i + 1:
+            # Les étapes non fusionnées produisent le même résultat : repli quelle que soit l'erreur
+            logger.debug(f"Fusion {adapter_name} failed ({error}), running unfused hops")
+            self.failed_fusions.add(adapter_info['adapters'])
+            return
+        if not isinstance(error, FALLBACK_ERRORS):
+            raise error
+        if self.first_error is None:
+            self.first_error = error
+        self.failed_edges.add((f_type, self.path[end]))
+        suffix = _fallback_route(self.routes, f_type, self.failed_edges)
+        if suffix is None:
+            raise self.first_error
+        logger.debug(f"Adapter {adapter_name} failed ({error}), falling back to {[t.__name__ for t in suffix]}")
+        self.path = self.path[:self.i] + suffix
+
+    def advance(self, end, adapter_info):
+        self.last_adapter = adapter_info['class']
+        self.i = end
+
+    def finish(self, result, output):
+        """Résultat final, écrit vers output si le dernier adaptateur ne l'a pas fait."""
+        if output is not None and not getattr(self.last_adapter, 'supports_output', False):
+            return _write_output(result, output)
+        return result
 
 
-def convert(obj, target_type):
+def _execute(snapshot, routes, obj, memory_budget=None, output=None, optimize=True):
+    """
+    Exécute la meilleure route ; en cas d'échec d'une étape, poursuit depuis le
+    dernier intermédiaire valide sur la route précalculée suivante (sans
+    nouvelle recherche ni ré-exécution des étapes terminées).
+
+    optimize: remplace les suites d'adaptateurs par les fusions enregistrées
+    et supprime les allers-retours sans perte (voir chimere.optimizer). Une
+    fusion en échec est réessayée étape par étape.
+
+    Sous memory_budget (en octets), chaque intermédiaire est libéré dès que
+    l'étape suivante est terminée. Un intermédiaire textuel dont la taille
+    estimée dépasse le budget est écrit directement dans un fichier temporaire
+    par l'adaptateur (supports_output) ; l'étape suivante le lit depuis ce
+    fichier. Un DataFrame (ou un texte produit en mémoire) dont la taille
+    dépasse le budget est déversé après l'étape (Arrow IPC) et relu par mmap,
+    ce qui libère le tas avant l'étape suivante. Les dict restent en mémoire.
+    output: fichier ou flux cible du résultat final.
+    Retourne (résultat, MemoryReport ou None).
+    """
+    plan = _RoutePlan(snapshot, routes, optimize)
+    report = MemoryReport(budget=memory_budget) if memory_budget is not None else None
+    store = SpillStore() if memory_budget is not None else None
+    current_obj = obj
+    try:
+        with traced_memory() if memory_budget is not None else nullcontext() as tracer:
+            while not plan.done():
+                end, adapter_info = plan.next_step()
+                is_last = plan.is_last(end)
+                estimated = 0
+                spilled = None
+                try:
+                    plan.start(end, adapter_info)
+                    adapter_name = adapter_info['class'].__name__
+                    hop_output = output if is_last else None
+                    if tracer is not None:
+                        estimated = estimate_output_size(adapter_info['class'](), current_obj)
+                        if not is_last and estimated > memory_budget \
+                                and getattr(adapter_info['class'], 'supports_output', False):
+                            spilled = store.spill_target(plan.path[end], estimated)
+                            if spilled is not None:
+                                logger.debug(f"{adapter_name}: sortie estimée à {estimated} octets, écrite dans {spilled.path}")
+                                hop_output = spilled.path
+                        tracer.reset_peak()
+                        baseline = tracer.current()
+                    next_obj = _apply(adapter_info, current_obj, hop_output)
+                    if spilled is not None:
+                        # L'étape suivante lit (ou mappe) le fichier à la demande
+                        next_obj = store.load(spilled)
+                except Exception as e:
+                    plan.fail(end, adapter_info, e)
+                    continue
+
+                # L'intermédiaire précédent est libéré dès la fin de l'étape
+                del current_obj
+                current_obj = next_obj
+                del next_obj
+                if tracer is not None:
+                    hop = HopMemory(
+                        adapter=adapter_name,
+                        estimated_output=estimated,
+                        output_size=estimate_size(current_obj),
+                        peak=max(tracer.peak() - baseline, 0),
+                        spilled=spilled is not None,
+                    )
+                    if not is_last and not hop.spilled and hop.output_size > memory_budget \
+                            and store.can_spill(current_obj):
+                        # Sortie construite en mémoire : remplacée par sa copie
+                        # sur disque, relue par mmap (Arrow IPC) ou à la demande
+                        spilled = store.spill(current_obj, hop.output_size)
+                        current_obj = None
+                        current_obj = store.load(spilled)
+                        hop.spilled = True
+                    report.hops.append(hop)
+                    logger.debug(
+                        f"Memory {adapter_name}: peak={hop.peak} output={hop.output_size} "
+                        f"estimated={hop.estimated_output} spilled={hop.spilled}"
+                    )
+                plan.advance(end, adapter_info)
+    finally:
+        if store is not None:
+            store.cleanup()
+    current_obj = plan.finish(current_obj, output)
+    if report is not None:
+        logger.debug(f"Memory peak for conversion: {report.peak} bytes (budget {memory_budget})")
+    return current_obj, report
+
+
+def convert(obj, target_type, memory_budget=None, constraints=None, alternatives=DEFAULT_ALTERNATIVES,
+            output=None, optimize=True, coalesce=False, return_report=False):
+    """
+    Convertit obj vers target_type en enchaînant les adaptateurs.
+    memory_budget: budget mémoire en octets pour les intermédiaires (optionnel).
+    constraints: RouteConstraints limitant les routes utilisables (optionnel).
+    alternatives: nombre de routes précalculées pour le repli si une étape échoue.
+    output: chemin ou flux dans lequel écrire le résultat (le dernier
+    adaptateur y écrit directement s'il le permet).
+    optimize: applique les fusions d'étapes enregistrées (chimere.optimizer).
+    coalesce: True/'identity' ou 'content' pour partager une même exécution
+    entre appels concurrents portant sur la même source (par identité ou
+    empreinte du contenu) et la même cible (voir chimere.singleflight). Le
+    résultat, ou l'erreur, est alors commun à tous les appelants.
+    return_report: retourne (résultat, MemoryReport) ; le rapport est None
+    sans memory_budget (voir chimere.memory.MemoryReport pour les limites
+    des mesures).
+    Une instance d'une sous-classe utilise les adaptateurs de ses classes de
+    base ; un sous-type enregistré de target_type peut être produit.
+    """
     from_type = type(obj)
-    if from_type == target_type:
-        return obj
+    if isinstance(obj, target_type):
+        result = obj if output is None else _write_output(obj, output)
+        if return_report:
+            return result, MemoryReport(budget=memory_budget) if memory_budget is not None else None
+        return result
+    if coalesce:
+        # Une exécution partagée publie toujours (résultat, rapport)
+        key = flight_key(obj, coalesce, target_type, constraints, alternatives, optimize, output_key(output))
+        result, report = SINGLE_FLIGHT.run(
+            key, convert, obj, target_type, memory_budget, constraints, alternatives, output, optimize, False, True
+        )
+        return (result, report) if return_report else result
 
+    # Un seul snapshot pour toute la conversion : le chemin et les adaptateurs
+    # restent cohérents même si un enregistrement a lieu en parallèle.
+    snapshot = get_snapshot()
     logger.debug(f"Attempting to convert {from_type.__name__} to {target_type.__name__}")
-    cost, path = find_conversion_path(from_type, target_type)
-    if path is None:
+    routes = _resolve_routes(from_type, target_type, alternatives, constraints, snapshot)
+    if not routes:
         raise ValueError(f"Aucun chemin de conversion trouvé entre {from_type.__name__} et {target_type.__name__}")
 
-    current_obj = obj
-    for i in range(len(path)-1):
-        f_type = path[i]
-        t_type = path[i+1]
-        adapter_info = ADAPTERS.get((f_type, t_type))
-        if adapter_info is None:
-            raise ValueError(f"Aucun adaptateur direct trouvé pour {f_type.__name__} -> {t_type.__name__}")
-        
-        adapter_cls = adapter_info['class']
-        validation_func = adapter_info['pre_validation']
-        adapter = adapter_cls()
-        # Validation
-        if validation_func is not None:
-            validation_func(adapter, current_obj)
-        
-        logger.debug(f"Using adapter {adapter_cls.__name__} ({f_type.__name__} -> {t_type.__name__})")
-        current_obj = adapter.convert(current_obj)
-    return current_obj
+    result, report = _execute(snapshot, routes, obj, memory_budget, output, optimize)
+    return (result, report) if return_report else result
@@ -0,0 +1,244 @@
+# chimere/csv_schema.py
+"""Module de cache des schémas CSV (types fixés après la première inférence)."""
+import csv
+import io
+import logging
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, Mapping, Optional, Sequence, Tuple
+
+import pandas as pd
+
+from .types import CSVData
+
+logger = logging.getLogger(__name__)
+
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+except ImportError:  # pragma: no cover - pyarrow est optionnel
+    pa = pa_csv = None
+
+# Une colonne texte devient catégorielle si elle a au plus CATEGORY_MAX_RATIO
+# valeurs distinctes par ligne (et au plus CATEGORY_MAX_UNIQUE valeurs)
+CATEGORY_MAX_RATIO = 0.5
+CATEGORY_MAX_UNIQUE = 10_000
+CACHE_SIZE = 256
+HEADER_MAX_BYTES = 1 << 16
+
+HeaderSignature = Tuple[str, ...]
+
+
+@dataclass(frozen=True)
+class CSVSchema:
+    """Types des colonnes d'un CSV, transmis tels quels à pandas.read_csv."""
+    dtypes: Mapping[str, Any]
+    inferred: bool = False
+
+    @classmethod
+    def coerce(cls, schema: Any) -> 'CSVSchema':
+        return schema if isinstance(schema, CSVSchema) else cls(dict(schema))
+
+
+@dataclass
+class SchemaCacheStats:
+    hits: int = 0
+    misses: int = 0
+    invalidations: int = 0
+
+
+class SchemaCache:
+    """Cache LRU borné : signature d'en-tête -> CSVSchema."""
+
+    def __init__(self, maxsize: int = CACHE_SIZE) -> None:
+        self.maxsize = maxsize
+        self.stats = SchemaCacheStats()
+        self._entries: 'OrderedDict[HeaderSignature, CSVSchema]' = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, signature: HeaderSignature) -> Optional[CSVSchema]:
+        with self._lock:
+            schema = self._entries.get(signature)
+            if schema is None:
+                self.stats.misses += 1
+            else:
+                self.stats.hits += 1
+                self._entries.move_to_end(signature)
+            return schema
+
+    def put(self, signature: HeaderSignature, schema: CSVSchema) -> None:
+        with self._lock:
+            self._entries[signature] = schema
+            self._entries.move_to_end(signature)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, signature: HeaderSignature) -> None:
+        with self._lock:
+            if self._entries.pop(signature, None) is not None:
+                self.stats.invalidations += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.stats = SchemaCacheStats()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, signature: HeaderSignature) -> bool:
+        return signature in self._entries
+
+
+SCHEMA_CACHE = SchemaCache()
+
+
+def register_csv_schema(columns: Sequence[str], dtypes: Mapping[str, Any]) -> CSVSchema:
+    """Déclare le schéma des CSV ayant exactement ces colonnes (dans cet ordre)."""
+    schema = CSVSchema.coerce(dtypes)
+    SCHEMA_CACHE.put(tuple(columns), schema)
+    return schema
+
+
+def header_signature(csv_obj: CSVData) -> Optional[HeaderSignature]:
+    """Noms des colonnes lus sur la première ligne (sans parser le reste)."""
+    source = csv_obj.source
+    if csv_obj.path is not None:
+        with open(csv_obj.path, 'rb') as f:
+            line = f.readline()
+    elif isinstance(source, str):
+        end = source.find('\n')
+        line = source if end < 0 else source[:end]
+    else:
+        head = bytes(source[:HEADER_MAX_BYTES])
+        end = head.find(b'\n')
+        if end < 0 and len(head) < csv_obj.size():
+            return None  # en-tête anormalement long : pas de cache
+        line = head if end < 0 else head[:end]
+    if isinstance(line, (bytes, bytearray)):
+        line = line.decode(csv_obj.encoding)
+    line = line.rstrip('\r\n')
+    if not line:
+        return None
+    return tuple(next(csv.reader([line])))
+
+
+def infer_schema(df: pd.DataFrame) -> CSVSchema:
+    """
+    Fige les types inférés par pandas ; les colonnes texte peu variées
+    deviennent catégorielles. Les colonnes sans aucune valeur (type inféré
+    par défaut) sont laissées hors du schéma.
+    """
+    dtypes: Dict[str, Any] = {}
+    rows = len(df)
+    for name in df.columns:
+        series = df[name]
+        if not series.notna().any():
+            continue
+        dtype = series.dtype
+        if dtype.kind in 'OT' or isinstance(dtype, pd.StringDtype):
+            distinct = series.nunique(dropna=True)
+            if rows and distinct <= CATEGORY_MAX_UNIQUE and distinct <= CATEGORY_MAX_RATIO * rows:
+                dtype = 'category'
+        dtypes[name] = dtype
+    return CSVSchema(dtypes, inferred=True)
+
+
+def _read(csv_obj: CSVData, **kwargs) -> pd.DataFrame:
+    source = csv_obj.source
+    if csv_obj.path is not None:
+        # Le parseur C lit le fichier mappé en mémoire
+        return pd.read_csv(csv_obj.path, memory_map=True, **kwargs)
+    if isinstance(source, str):
+        return pd.read_csv(io.StringIO(source), **kwargs)
+    return pd.read_csv(io.BytesIO(source), **kwargs)
+
+
+def _arrow_type(dtype: Any):
+    dtype = pd.api.types.pandas_dtype(dtype)
+    if isinstance(dtype, pd.CategoricalDtype):
+        return pa.dictionary(pa.int32(), pa.string()) if dtype.categories is None else None
+    if isinstance(dtype, pd.StringDtype) or dtype == object:
+        return pa.string()
+    if dtype.kind in 'biuf':
+        return pa.from_numpy_dtype(dtype)
+    return None
+
+
+def _read_arrow(csv_obj: CSVData, schema: CSVSchema) -> Optional[pd.DataFrame]:
+    """
+    Lecture multi-thread par pyarrow.csv avec les types imposés (conversion
+    stricte : '7.5' dans une colonne entière est une erreur, pas une troncature).
+    Renvoie None si un type du schéma n'a pas d'équivalent Arrow.
+    """
+    column_types = {}
+    for name, dtype in schema.dtypes.items():
+        arrow_type = _arrow_type(dtype)
+        if arrow_type is None:
+            return None
+        column_types[name] = arrow_type
+    source = csv_obj.source
+    if csv_obj.path is not None:
+        stream = pa.memory_map(str(csv_obj.path))
+    else:
+        if isinstance(source, str):
+            source = source.encode(csv_obj.encoding)
+        stream = pa.BufferReader(pa.py_buffer(source))
+    with stream:
+        table = pa_csv.read_csv(stream, convert_options=pa_csv.ConvertOptions(
+            column_types=column_types, strings_can_be_null=True,
+        ))
+    for name, arrow_type in column_types.items():
+        if (pa.types.is_integer(arrow_type) or pa.types.is_boolean(arrow_type)) \
+                and name in table.column_names and table.column(name).null_count:
+            # pandas convertirait silencieusement en float64 / object
+            raise ValueError(f"Valeurs manquantes dans la colonne {name} de type {arrow_type}")
+    return table.to_pandas()
+
+
+def _read_with_schema(csv_obj: CSVData, schema: CSVSchema) -> pd.DataFrame:
+    if pa_csv is not None:
+        df = _read_arrow(csv_obj, schema)
+        if df is not None:
+            return df
+    return _read(csv_obj, dtype=dict(schema.dtypes))
+
+
+def _apply_schema(df: pd.DataFrame, schema: CSVSchema) -> pd.DataFrame:
+    changed = {name: dtype for name, dtype in schema.dtypes.items() if df[name].dtype != dtype}
+    return df.astype(changed) if changed else df
+
+
+def read_csv(csv_obj: CSVData, cache: Optional[SchemaCache] = SCHEMA_CACHE) -> pd.DataFrame:
+    """
+    Lit un CSVData en DataFrame.
+    Schéma explicite (csv_obj.schema) : types imposés, erreurs propagées.
+    Sinon le schéma est cherché dans le cache par signature d'en-tête ; à
+    défaut pandas infère les types, qui sont figés pour les CSV suivants.
+    Un CSV incompatible avec le schéma inféré (NA dans une colonne entière,
+    texte dans une colonne numérique...) est relu et le schéma remplacé.
+    """
+    if csv_obj.schema is not None:
+        return _read_with_schema(csv_obj, CSVSchema.coerce(csv_obj.schema))
+
+    signature = header_signature(csv_obj) if cache is not None else None
+    if signature is not None:
+        schema = cache.get(signature)
+        if schema is not None:
+            try:
+                return _read_with_schema(csv_obj, schema)
+            except (ValueError, TypeError) as e:  # ArrowInvalid hérite de ValueError
+                if not schema.inferred:
+                    raise
+                logger.debug(f"Schéma CSV en cache incompatible ({e}), nouvelle inférence")
+                cache.invalidate(signature)
+
+    df = _read(csv_obj)
+    if signature is None or tuple(df.columns) != signature or df.empty:
+        # Colonnes dupliquées ou renommées par pandas, ou aucune ligne dont
+        # inférer les types : pas de schéma réutilisable
+        return df
+    schema = infer_schema(df)
+    cache.put(signature, schema)
+    return _apply_schema(df, schema)
@@ -1,19 +1,34 @@
 # chimere/dynamic_types.py
 """Module de génération dynamique des types."""
 import ctypes
-from typing import Type, Dict, Any
+import threading
+from typing import Type, Dict, Any, Tuple
 from .metadata import StructureMetadata
 
 class DynamicStructureFactory:
-    """Fabrique de structures dynamiques."""
-    _cache: Dict[str, Type[ctypes.Structure]] = {}
+    """
+    Fabrique de structures dynamiques.
+    Le cache est indexé par (nom, version) et publié en copy-on-write :
+    la lecture se fait sans verrou.
+    """
+    _cache: Dict[Tuple[str, str], Tuple[StructureMetadata, Type[ctypes.Structure]]] = {}
+    _lock = threading.Lock()
     
     @classmethod
     def create_structure(cls, metadata: StructureMetadata) -> Type[ctypes.Structure]:
         """Crée ou récupère une structure ctypes dynamique."""
-        if metadata.name not in cls._cache:
-            cls._cache[metadata.name] = cls._create_new_structure(metadata)
-        return cls._cache[metadata.name]
+        key = (metadata.name, metadata.version)
+        entry = cls._cache.get(key)
+        # Les métadonnées peuvent être ré-enregistrées sous la même version :
+        # on vérifie l'identité pour ne pas servir une structure périmée.
+        if entry is not None and entry[0] is metadata:
+            return entry[1]
+        with cls._lock:
+            entry = cls._cache.get(key)
+            if entry is None or entry[0] is not metadata:
+                entry = (metadata, cls._create_new_structure(metadata))
+                cls._cache = {**cls._cache, key: entry}
+        return entry[1]
     
     @staticmethod
     def _create_new_structure(metadata: StructureMetadata) -> Type[ctypes.Structure]:
@@ -28,13 +43,19 @@ class DynamicStructureFactory:
         )
 
 class DynamicStructData:
-    def __init__(self, ptr: Any, metadata: StructureMetadata) -> None:
+    def __init__(self, ptr: Any, metadata: StructureMetadata, owner: Any = None) -> None:
+        """
+        ptr: pointeur ctypes vers la structure
+        owner: buffer Python propriétaire de la mémoire (la structure n'est
+               alors pas libérée par la bibliothèque native)
+        """
         self.ptr = ptr
         self.metadata = metadata
-        self._lib = ctypes.CDLL(str(metadata.dll_path))
+        self.owner = owner
+        self._lib = ctypes.CDLL(str(metadata.dll_path)) if owner is None else None
         
     def __del__(self) -> None:
-        if hasattr(self, 'ptr') and self.ptr:
+        if getattr(self, 'owner', None) is None and hasattr(self, 'ptr') and self.ptr:
             free_name = self.metadata.function_prefix.replace('create_', 'free_')
             free_func = getattr(self._lib, free_name)
             free_func(self.ptr)
\ No newline at end of file
@@ -0,0 +1,133 @@
+# chimere/jsonlines.py
+"""Module de parsing parallèle du JSON Lines (NDJSON)."""
+import json
+import mmap
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Any, List, Optional, Tuple
+
+from .types import JSONLinesData
+
+# En dessous de ce volume le parsing reste dans le processus courant
+PARALLEL_MIN_BYTES = 4 << 20
+# Taille minimale d'une plage confiée à un processus
+MIN_RANGE_BYTES = 1 << 20
+
+
+class _Settings:
+    executor: Optional[Executor] = None
+    workers: Optional[int] = None
+
+
+def configure(executor: Optional[Executor] = None, workers: Optional[int] = None) -> None:
+    """
+    Configure le parsing parallèle.
+    executor: pool de processus réutilisé entre conversions (un pool
+              temporaire est créé pour chaque conversion si None)
+    workers: nombre de plages / processus par défaut (os.cpu_count() si None)
+    """
+    _Settings.executor = executor
+    _Settings.workers = workers
+
+
+@dataclass(frozen=True)
+class BadLine:
+    """Ligne invalide rencontrée en mode errors='skip' (numérotée à partir de 1)."""
+    line: int
+    error: str
+
+
+class JSONLinesError(ValueError):
+    """Ligne JSON invalide en mode errors='raise'."""
+
+    def __init__(self, bad_line: BadLine) -> None:
+        super().__init__(f"JSON Lines invalide ligne {bad_line.line}: {bad_line.error}")
+        self.bad_line = bad_line
+
+
+def split_ranges(buffer: Any, parts: int) -> List[Tuple[int, int]]:
+    """Découpe buffer en au plus parts plages [début, fin) terminées par un saut de ligne."""
+    size = len(buffer)
+    ranges = []
+    start = 0
+    for i in range(1, parts):
+        cut = max(size * i // parts, start)
+        end = buffer.find(b'\n', cut)
+        if end < 0:
+            break
+        if end + 1 > start:
+            ranges.append((start, end + 1))
+            start = end + 1
+    if start < size or not ranges:
+        ranges.append((start, size))
+    return ranges
+
+
+def _parse_lines(data: bytes, strict: bool) -> Tuple[List[Any], List[BadLine], int]:
+    """Parse les lignes de data ; numéros de ligne relatifs au début de data."""
+    records = []
+    bad_lines = []
+    lines = data.split(b'\n')
+    if lines and not lines[-1]:
+        lines.pop()
+    for number, line in enumerate(lines, 1):
+        if not line.strip():
+            continue
+        try:
+            records.append(json.loads(line))
+        except ValueError as e:
+            bad_line = BadLine(number, str(e))
+            if strict:
+                # Renvoyée telle quelle : le numéro absolu est calculé par l'appelant
+                return records, [bad_line], len(lines)
+            bad_lines.append(bad_line)
+    return records, bad_lines, len(lines)
+
+
+def _parse_range(source: Any, start: int, end: int, strict: bool) -> Tuple[List[Any], List[BadLine], int]:
+    """Tâche d'un processus : source est un chemin (mappé localement) ou les octets de la plage."""
+    if isinstance(source, str):
+        with open(source, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            return _parse_lines(mapped[start:end], strict)
+    return _parse_lines(source, strict)
+
+
+def parse(obj: JSONLinesData) -> Tuple[List[Any], List[BadLine]]:
+    """
+    Parse un JSONLinesData ; renvoie les documents (dans l'ordre du fichier)
+    et les lignes invalides ignorées.
+    Au-delà de PARALLEL_MIN_BYTES, l'entrée est découpée en plages alignées
+    sur les sauts de ligne, parsées par des processus puis fusionnées dans
+    l'ordre. Un fichier n'est pas transmis aux processus : chacun le mappe.
+    """
+    strict = obj.errors == 'raise'
+    buffer = obj.buffer()
+    if isinstance(buffer, memoryview):
+        buffer = buffer.tobytes()
+    workers = obj.workers or _Settings.workers or os.cpu_count() or 1
+    parts = min(workers, max(len(buffer) // MIN_RANGE_BYTES, 1))
+    if len(buffer) < PARALLEL_MIN_BYTES or parts < 2:
+        chunks = [_parse_lines(bytes(buffer), strict)]
+    else:
+        ranges = split_ranges(buffer, parts)
+        path = str(obj.path) if obj.path is not None else None
+        sources = [path] * len(ranges) if path is not None else [bytes(buffer[s:e]) for s, e in ranges]
+        executor = _Settings.executor
+        if executor is None:
+            with ProcessPoolExecutor(max_workers=len(ranges)) as pool:
+                chunks = list(pool.map(_parse_range, sources, *zip(*ranges), [strict] * len(ranges)))
+        else:
+            chunks = list(executor.map(_parse_range, sources, *zip(*ranges), [strict] * len(ranges)))
+
+    records: List[Any] = []
+    bad_lines: List[BadLine] = []
+    offset = 0
+    for chunk_records, chunk_bad_lines, line_count in chunks:
+        shifted = [BadLine(bad.line + offset, bad.error) for bad in chunk_bad_lines]
+        if strict and shifted:
+            raise JSONLinesError(shifted[0])
+        records.extend(chunk_records)
+        bad_lines.extend(shifted)
+        offset += line_count
+    return records, bad_lines
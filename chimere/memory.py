@@ -0,0 +1,224 @@
+# chimere/memory.py
+"""Module d'estimation mémoire et de déversement (spill) des intermédiaires."""
+import ctypes
+import os
+import shutil
+import sys
+import tempfile
+import threading
+import tracemalloc
+from pathlib import Path
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Tuple, Type
+
+from .types import (
+    CSVData, JSONData, JSONLinesData, PandasDataFrameData, ParquetData, PythonDictData, TextRepresentation, XMLData
+)
+from .dynamic_types import DynamicStructData
+
+try:
+    import pyarrow.feather as feather
+except ImportError:  # pragma: no cover - pyarrow est optionnel
+    feather = None
+
+
+def _deep_sizeof(value: Any, limit: int = 100_000) -> int:
+    """Taille approximative d'un objet Python et de son contenu (bornée à limit objets)."""
+    seen = set()
+    stack = [value]
+    total = 0
+    while stack and len(seen) < limit:
+        item = stack.pop()
+        if id(item) in seen:
+            continue
+        seen.add(id(item))
+        total += sys.getsizeof(item)
+        if isinstance(item, dict):
+            stack.extend(item.keys())
+            stack.extend(item.values())
+        elif isinstance(item, (list, tuple, set, frozenset)):
+            stack.extend(item)
+    return total
+
+
+def estimate_size(obj: Any) -> int:
+    """Estime l'empreinte mémoire (en octets) d'une représentation."""
+    if isinstance(obj, TextRepresentation):
+        return obj.memory_size()
+    if isinstance(obj, PythonDictData):
+        return _deep_sizeof(obj.data)
+    if isinstance(obj, PandasDataFrameData):
+        return int(obj.df.memory_usage(index=True, deep=True).sum())
+    if isinstance(obj, ParquetData):
+        return sys.getsizeof(obj.path)
+    if isinstance(obj, DynamicStructData):
+        return ctypes.sizeof(obj.ptr.contents) if obj.ptr else 0
+    return _deep_sizeof(obj)
+
+
+def estimate_output_size(adapter: Any, obj: Any) -> int:
+    """
+    Taille estimée de la sortie d'un adaptateur.
+    Les adaptateurs peuvent fournir estimate_output_size(obj) ; à défaut on
+    suppose une sortie de la taille de l'entrée.
+    """
+    estimator = getattr(adapter, 'estimate_output_size', None)
+    if estimator is not None:
+        return int(estimator(obj))
+    return estimate_size(obj)
+
+
+@dataclass
+class SpilledData:
+    """Référence vers un intermédiaire déversé sur disque."""
+    path: str
+    original_type: Type
+    size: int
+
+
+def _spill_dataframe(obj: PandasDataFrameData, path: str) -> None:
+    feather.write_feather(obj.df, path, compression='uncompressed')
+
+
+def _load_dataframe(path: str) -> PandasDataFrameData:
+    # Lecture memory-mappée du fichier Arrow IPC : split_blocks évite la
+    # consolidation des colonnes, les colonnes numériques restent des vues
+    # sur le fichier mappé au lieu d'être copiées sur le tas
+    return PandasDataFrameData(feather.read_table(path, memory_map=True).to_pandas(split_blocks=True))
+
+
+def _spill_text(obj: Any, path: str) -> None:
+    obj.write_to(path)
+
+
+def _load_text(cls: Type) -> Callable[[str], Any]:
+    def load(path: str) -> Any:
+        # Rechargement paresseux : le fichier n'est lu (ou mappé) que par l'adaptateur suivant
+        return cls(Path(path))
+    return load
+
+
+# Formats de déversement : type -> (extension, spill(obj, path), load(path)).
+# Un dict relu depuis le disque serait entièrement reconstruit en mémoire :
+# il n'est pas déversé.
+SPILLERS: Dict[Type, Tuple[str, Callable, Callable]] = {
+    JSONData: ('.json', _spill_text, _load_text(JSONData)),
+    CSVData: ('.csv', _spill_text, _load_text(CSVData)),
+    XMLData: ('.xml', _spill_text, _load_text(XMLData)),
+    JSONLinesData: ('.jsonl', _spill_text, _load_text(JSONLinesData)),
+}
+if feather is not None:
+    SPILLERS[PandasDataFrameData] = ('.arrow', _spill_dataframe, _load_dataframe)
+
+
+class SpillStore:
+    """Stockage temporaire local des intermédiaires dépassant le budget mémoire."""
+
+    def __init__(self, directory: Optional[str] = None) -> None:
+        self._parent = directory
+        self._directory: Optional[str] = None
+        self._counter = 0
+
+    def can_spill(self, obj: Any) -> bool:
+        return type(obj) in SPILLERS
+
+    def _new_path(self, extension: str) -> str:
+        if self._directory is None:
+            self._directory = tempfile.mkdtemp(prefix='chimere-spill-', dir=self._parent)
+        self._counter += 1
+        return os.path.join(self._directory, f"{self._counter}{extension}")
+
+    def spill(self, obj: Any, size: int) -> SpilledData:
+        extension, spill, _ = SPILLERS[type(obj)]
+        path = self._new_path(extension)
+        spill(obj, path)
+        return SpilledData(path=path, original_type=type(obj), size=size)
+
+    def spill_target(self, target_type: Type, size: int) -> Optional[SpilledData]:
+        """
+        Fichier dans lequel un adaptateur écrit directement une sortie
+        textuelle, sans la construire en mémoire (None pour un autre type).
+        """
+        if not issubclass(target_type, TextRepresentation) or target_type not in SPILLERS:
+            return None
+        return SpilledData(path=self._new_path(SPILLERS[target_type][0]), original_type=target_type, size=size)
+
+    def load(self, spilled: SpilledData) -> Any:
+        _, _, load = SPILLERS[spilled.original_type]
+        return load(spilled.path)
+
+    def cleanup(self) -> None:
+        if self._directory is not None:
+            shutil.rmtree(self._directory, ignore_errors=True)
+            self._directory = None
+
+
+@dataclass
+class HopMemory:
+    """Mesures mémoire d'une étape de conversion."""
+    adapter: str
+    estimated_output: int
+    output_size: int
+    peak: int
+    spilled: bool = False
+
+
+@dataclass
+class MemoryReport:
+    """
+    Rapport mémoire d'une conversion sous budget (convert(..., return_report=True)).
+    Les pics sont mesurés par tracemalloc, global au processus : des
+    conversions sous budget simultanées faussent mutuellement leurs pics par
+    étape, et seule la mémoire allouée via Python est comptée (pas les
+    tampons Arrow ni les fichiers mappés).
+    """
+    budget: int
+    hops: List[HopMemory] = field(default_factory=list)
+
+    @property
+    def peak(self) -> int:
+        return max((hop.peak for hop in self.hops), default=0)
+
+
+_TRACING_LOCK = threading.Lock()
+_TRACING_USERS = 0
+_TRACING_STARTED = False
+
+
+class traced_memory:
+    """
+    Contexte démarrant tracemalloc si nécessaire (compteur partagé entre threads).
+    Les pics sont globaux au processus : sous forte concurrence ils sont
+    approximatifs. Une session tracemalloc ouverte par l'appelant n'est
+    jamais remise à zéro : peak() renvoie alors la mémoire courante (borne
+    basse du pic).
+    """
+
+    def __enter__(self) -> 'traced_memory':
+        global _TRACING_USERS, _TRACING_STARTED
+        with _TRACING_LOCK:
+            if _TRACING_USERS == 0 and not tracemalloc.is_tracing():
+                tracemalloc.start()
+                _TRACING_STARTED = True
+            _TRACING_USERS += 1
+        return self
+
+    def reset_peak(self) -> None:
+        if _TRACING_STARTED:
+            tracemalloc.reset_peak()
+
+    def current(self) -> int:
+        return tracemalloc.get_traced_memory()[0]
+
+    def peak(self) -> int:
+        if _TRACING_STARTED:
+            return tracemalloc.get_traced_memory()[1]
+        return self.current()
+
+    def __exit__(self, *exc_info) -> None:
+        global _TRACING_USERS, _TRACING_STARTED
+        with _TRACING_LOCK:
+            _TRACING_USERS -= 1
+            if _TRACING_USERS == 0 and _TRACING_STARTED:
+                tracemalloc.stop()
+                _TRACING_STARTED = False
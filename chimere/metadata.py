@@ -1,11 +1,13 @@
 # chimere/metadata.py
 """Module gérant les métadonnées des structures."""
 from dataclasses import dataclass
-from typing import Dict, Any, Type, Optional, List
+from typing import Dict, Any, Type, Optional, List, Mapping
 import ctypes
 import json
 import logging
+import threading
 from pathlib import Path
+from types import MappingProxyType
 
 logger = logging.getLogger(__name__)
 
@@ -28,8 +30,13 @@ class StructureMetadata:
     version: str = "1.0.0"
 
 class MetadataRegistry:
-    """Registre global des métadonnées de structures."""
-    _structures: Dict[str, StructureMetadata] = {}
+    """
+    Registre global des métadonnées de structures.
+    _structures est une vue immuable remplacée à chaque enregistrement
+    (copy-on-write) : get_structure lit sans verrou.
+    """
+    _structures: Mapping[str, StructureMetadata] = MappingProxyType({})
+    _lock = threading.Lock()
     
     @classmethod
     def register_from_json(cls, json_path: Path) -> None:
@@ -58,7 +65,7 @@ class MetadataRegistry:
                 for field_name, field_spec in spec["fields"].items()
             }
             
-            cls._structures[name] = StructureMetadata(
+            metadata = StructureMetadata(
                 name=name,
                 fields=fields,
                 dll_path=Path(spec["dll_path"]),
@@ -68,6 +75,10 @@ class MetadataRegistry:
             )
         except (KeyError, AttributeError) as e:
             raise ValueError(f"Spécification invalide pour {name}: {e}")
+        with cls._lock:
+            structures = dict(cls._structures)
+            structures[name] = metadata
+            cls._structures = MappingProxyType(structures)
 
     @classmethod
     def get_structure(cls, name: str) -> StructureMetadata:
@@ -0,0 +1,102 @@
+# chimere/optimizer.py
+"""Module d'optimisation des chemins : fusion d'étapes et suppression des allers-retours."""
+import threading
+from types import MappingProxyType
+from typing import Any, Iterable, List, Mapping, Optional, Sequence, Tuple
+
+# Clé: suite de classes d'adaptateurs ; Valeur: {class, adapters, pre_validation}
+_FUSIONS: Mapping[Tuple[type, ...], Mapping[str, Any]] = MappingProxyType({})
+_MAX_LENGTH = 0
+_LOCK = threading.Lock()
+
+_FIDELITY_ORDER = ('low', 'medium', 'high')
+
+
+def register_fusion(*adapter_classes):
+    """
+    Décorateur pour déclarer une implémentation fusionnée remplaçant la suite
+    d'adaptateurs adapter_classes (dans l'ordre du chemin).
+    La classe suit le protocole des adaptateurs (validate_input optionnel,
+    convert, supports_output, estimate_output_size) et doit produire le même
+    résultat que la suite non fusionnée.
+    """
+    if len(adapter_classes) < 2:
+        raise ValueError("Une fusion remplace au moins deux adaptateurs")
+
+    def decorator(cls):
+        global _FUSIONS, _MAX_LENGTH
+        info = MappingProxyType({
+            'class': cls,
+            'adapters': tuple(adapter_classes),
+            'pre_validation': getattr(cls, 'validate_input', None),
+        })
+        with _LOCK:
+            _FUSIONS = MappingProxyType({**_FUSIONS, tuple(adapter_classes): info})
+            _MAX_LENGTH = max(_MAX_LENGTH, len(adapter_classes))
+        return cls
+    return decorator
+
+
+def get_fusions() -> Mapping[Tuple[type, ...], Mapping[str, Any]]:
+    return _FUSIONS
+
+
+def match_fusion(snapshot, path: Sequence[type], i: int, disabled: Iterable = ()) -> Optional[Tuple[int, Mapping[str, Any]]]:
+    """
+    Plus longue fusion applicable à partir de path[i].
+    Retourne (indice d'arrivée dans path, info) ou None ; info porte aussi le
+    coût cumulé et la fidélité la plus faible des étapes remplacées.
+    """
+    fusions = _FUSIONS
+    if not fusions:
+        return None
+    infos = []
+    for j in range(i, min(len(path) - 1, i + _MAX_LENGTH)):
+        info = snapshot.get((path[j], path[j+1]))
+        if info is None:
+            break
+        infos.append(info)
+    for length in range(len(infos), 1, -1):
+        key = tuple(info['class'] for info in infos[:length])
+        fusion = fusions.get(key)
+        if fusion is not None and key not in disabled:
+            return i + length, {
+                **fusion,
+                'cost': sum(info['cost'] for info in infos[:length]),
+                'fidelity': min((info['fidelity'] for info in infos[:length]), key=_FIDELITY_ORDER.index),
+            }
+    return None
+
+
+def remove_round_trips(snapshot, path: Sequence[type]) -> List[type]:
+    """
+    Supprime les boucles A -> ... -> A (ex. dict -> JSON -> dict) dont toutes
+    les étapes sont de fidélité 'high' ; les boucles avec perte (qui
+    normalisent la donnée) sont conservées.
+    """
+    path = list(path)
+    i = 0
+    while i < len(path) - 1:
+        j = len(path) - 1 - path[::-1].index(path[i])
+        if j > i and all(
+            (snapshot.get((path[k], path[k+1])) or {}).get('fidelity') == 'high' for k in range(i, j)
+        ):
+            del path[i:j]
+            continue
+        i += 1
+    return path
+
+
+def apply_chain(adapter_classes: Sequence[type], obj: Any, output: Any = None) -> Any:
+    """Exécute la suite non fusionnée (repli des fusions hors de leur cas rapide)."""
+    last = len(adapter_classes) - 1
+    for index, adapter_cls in enumerate(adapter_classes):
+        adapter = adapter_cls()
+        if hasattr(adapter, 'validate_input'):
+            adapter.validate_input(obj)
+        if index == last and output is not None and getattr(adapter, 'supports_output', False):
+            return adapter.convert(obj, output=output)
+        obj = adapter.convert(obj)
+    if output is not None:
+        obj.write_to(output)
+    return obj
@@ -0,0 +1,362 @@
+# chimere/packed.py
+"""Module de représentation binaire compacte des structures (packed structs)."""
+import ctypes
+import struct
+import threading
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Type, Union
+
+import numpy as np
+
+from .dynamic_types import DynamicStructureFactory
+from .exceptions import ValidationError
+from .metadata import MetadataRegistry, StructureMetadata
+from .registry import register_adapter
+from .types import BaseRepresentation
+
+Buffer = Union[bytes, bytearray, memoryview]
+
+# En-tête : magic, flags, nombre d'enregistrements (16 octets, aligné sur 8)
+HEADER = struct.Struct('<4sIQ')
+MAGIC = b'CHPK'
+# Les champs pointeurs contiennent des adresses absolues (voir as_ctypes)
+FLAG_RELOCATED = 0x1
+
+_POINTER_CTYPES = (ctypes.c_char_p, ctypes.c_void_p)
+_FLOAT_CODES = {4: 'f', 8: 'd'}
+_INT_CODES = {1: 'b', 2: 'h', 4: 'i', 8: 'q'}
+_NUMPY_CODES = {
+    'b': 'i1', 'B': 'u1', 'h': 'i2', 'H': 'u2', 'i': 'i4', 'I': 'u4',
+    'q': 'i8', 'Q': 'u8', 'f': 'f4', 'd': 'f8', '?': '?', 'c': 'S1',
+}
+
+
+def _struct_code(ctype: Type) -> str:
+    """Code struct (taille standard, little-endian) équivalent au type ctypes."""
+    if ctype in _POINTER_CTYPES:
+        return 'Q'
+    code = getattr(ctype, '_type_', None)
+    size = ctypes.sizeof(ctype)
+    if code == '?':
+        return '?'
+    if code == 'c':
+        return 'c'
+    if code in ('f', 'd', 'g') and size in _FLOAT_CODES:
+        return _FLOAT_CODES[size]
+    if isinstance(code, str) and code in 'bBhHiIlLqQ' and size in _INT_CODES:
+        signed = _INT_CODES[size]
+        return signed if code.islower() else signed.upper()
+    raise ValidationError(f"Type ctypes non supporté pour le format packed: {ctype.__name__}")
+
+
+class StructCodec:
+    """
+    Format binaire précompilé d'une structure.
+    Le layout d'un enregistrement est identique à celui de la structure ctypes
+    (mêmes offsets et padding), ce qui permet from_buffer sans copie. Les
+    chaînes sont stockées dans un tas en fin de buffer ; les champs pointeurs
+    contiennent l'offset de la chaîne depuis le début du buffer (0 : NULL).
+    """
+
+    def __init__(self, metadata: StructureMetadata) -> None:
+        self.metadata = metadata
+        self.struct_type = DynamicStructureFactory.create_structure(metadata)
+        self.size = ctypes.sizeof(self.struct_type)
+        self.fields = list(metadata.fields.values())
+        self.pointer_fields = [f.name for f in self.fields if f.ctype in _POINTER_CTYPES]
+
+        fmt = '<'
+        position = 0
+        names, formats, offsets = [], [], []
+        for f in self.fields:
+            offset = getattr(self.struct_type, f.name).offset
+            code = _struct_code(f.ctype)
+            fmt += 'x' * (offset - position) + code
+            position = offset + struct.calcsize('<' + code)
+            names.append(f.name)
+            formats.append('<' + _NUMPY_CODES[code])
+            offsets.append(offset)
+        fmt += 'x' * (self.size - position)
+        self.record = struct.Struct(fmt)
+        self.dtype = np.dtype({'names': names, 'formats': formats,
+                               'offsets': offsets, 'itemsize': self.size})
+
+    def _values(self, record: Dict[str, Any], heap: bytearray, heap_start: int) -> List[Any]:
+        values = []
+        for f in self.fields:
+            value = record.get(f.name)
+            if value is None:
+                if not f.nullable:
+                    raise ValidationError(f"Le champ {f.name} ne peut pas être null")
+                values.append(False if f.ctype is ctypes.c_bool else 0)
+            elif f.name in self.pointer_fields:
+                if isinstance(value, str):
+                    value = value.encode('utf-8')
+                if not isinstance(value, bytes):
+                    raise ValidationError(
+                        f"Type invalide pour {f.name}: attendu {f.type}, reçu {type(value)}"
+                    )
+                values.append(heap_start + len(heap))
+                heap += value.replace(b'\0', b'') + b'\0'
+            elif f.ctype is ctypes.c_char and isinstance(value, str):
+                values.append(value.encode('utf-8'))
+            else:
+                values.append(value)
+        return values
+
+    def pack(self, records: List[Dict[str, Any]]) -> bytearray:
+        """Encode une liste d'enregistrements dans un nouveau buffer."""
+        missing = [f.name for f in self.fields if not f.nullable]
+        heap_start = HEADER.size + len(records) * self.size
+        buffer = bytearray(heap_start)
+        HEADER.pack_into(buffer, 0, MAGIC, 0, len(records))
+        heap = bytearray()
+        for i, record in enumerate(records):
+            unknown = set(record) - set(self.metadata.fields)
+            if unknown:
+                raise ValidationError(f"Champs inconnus: {unknown}")
+            absent = [name for name in missing if name not in record]
+            if absent:
+                raise ValidationError(f"Champs requis manquants: {set(absent)}")
+            try:
+                self.record.pack_into(buffer, HEADER.size + i * self.size,
+                                      *self._values(record, heap, heap_start))
+            except struct.error as e:
+                raise ValidationError(f"Valeur invalide pour {self.metadata.name}: {e}")
+        buffer += heap
+        return buffer
+
+    def pack_columns(self, columns: Dict[str, Any], count: int) -> bytearray:
+        """Encode des colonnes (séquences de même longueur) de façon vectorisée."""
+        heap_start = HEADER.size + count * self.size
+        buffer = bytearray(heap_start)
+        HEADER.pack_into(buffer, 0, MAGIC, 0, count)
+        array = np.frombuffer(buffer, dtype=self.dtype, count=count, offset=HEADER.size)
+        heap = bytearray()
+        for f in self.fields:
+            if f.name not in columns:
+                if not f.nullable:
+                    raise ValidationError(f"Champs requis manquants: {{'{f.name}'}}")
+                continue
+            column = columns[f.name]
+            if f.name in self.pointer_fields:
+                offsets = np.zeros(count, dtype='<u8')
+                for i, value in enumerate(column):
+                    if value is None or (isinstance(value, float) and value != value):  # None ou NaN
+                        if not f.nullable:
+                            raise ValidationError(f"Le champ {f.name} ne peut pas être null")
+                        continue
+                    if isinstance(value, str):
+                        value = value.encode('utf-8')
+                    if not isinstance(value, bytes):
+                        raise ValidationError(
+                            f"Type invalide pour {f.name}: attendu {f.type}, reçu {type(value)}"
+                        )
+                    encoded = value
+                    offsets[i] = heap_start + len(heap)
+                    heap += encoded.replace(b'\0', b'') + b'\0'
+                array[f.name] = offsets
+            else:
+                try:
+                    array[f.name] = np.asarray(column)
+                except (TypeError, ValueError) as e:
+                    raise ValidationError(f"Type invalide pour {f.name}: {e}")
+        del array
+        buffer += heap
+        return buffer
+
+
+class PackedStructData(BaseRepresentation):
+    """
+    Enregistrements de structure encodés dans un buffer binaire compact.
+    buffer: bytes, bytearray ou memoryview au format StructCodec
+    metadata: métadonnées de la structure (par défaut celles de la classe)
+    """
+    metadata: Optional[StructureMetadata] = None
+
+    def __init__(self, buffer: Buffer, metadata: Optional[StructureMetadata] = None) -> None:
+        metadata = metadata or type(self).metadata
+        if metadata is None:
+            raise ValidationError("PackedStructData nécessite des métadonnées de structure")
+        self.metadata = metadata
+        self.codec = PackedStructFactory.codec(metadata)
+        self.buffer = buffer
+        magic, self.flags, self.count = HEADER.unpack_from(buffer, 0)
+        if magic != MAGIC:
+            raise ValidationError("Buffer packed invalide")
+
+    @classmethod
+    def for_structure(cls, structure: Union[str, StructureMetadata]) -> Type['PackedStructData']:
+        """Retourne la sous-classe liée à une structure (les adaptateurs y sont enregistrés)."""
+        if isinstance(structure, str):
+            structure = MetadataRegistry.get_structure(structure)
+        return PackedStructFactory.create_type(structure)
+
+    @classmethod
+    def codec_for(cls, metadata: Optional[StructureMetadata] = None) -> StructCodec:
+        """Codec précompilé de la structure (celle de la classe par défaut)."""
+        metadata = metadata or cls.metadata
+        if metadata is None:
+            raise ValidationError("PackedStructData nécessite des métadonnées de structure")
+        return PackedStructFactory.codec(metadata)
+
+    def _base_address(self) -> int:
+        view = memoryview(self.buffer)
+        if view.readonly:
+            raise ValidationError("Un buffer en lecture seule ne peut pas être relocalisé")
+        return ctypes.addressof(ctypes.c_char.from_buffer(view))
+
+    def _string_reader(self):
+        """Retourne une fonction décodant la chaîne pointée par un champ pointeur."""
+        heap_start = HEADER.size + self.count * self.codec.size
+        heap = bytes(memoryview(self.buffer)[heap_start:])
+        base = self._base_address() if self.flags & FLAG_RELOCATED else 0
+
+        def read(pointer: int) -> Optional[str]:
+            if not pointer:
+                return None
+            start = pointer - base - heap_start
+            return heap[start:heap.index(b'\0', start)].decode('utf-8')
+        return read
+
+    def records(self) -> Iterator[Dict[str, Any]]:
+        """Décode les enregistrements un à un."""
+        read = self._string_reader()
+        pointer_fields = set(self.codec.pointer_fields)
+        names = [f.name for f in self.codec.fields]
+        for i in range(self.count):
+            values = self.codec.record.unpack_from(self.buffer, HEADER.size + i * self.codec.size)
+            record = {}
+            for name, value in zip(names, values):
+                if name in pointer_fields:
+                    value = read(value)
+                elif isinstance(value, bytes):
+                    value = value.decode('utf-8')
+                record[name] = value
+            yield record
+
+    def array(self) -> np.ndarray:
+        """Vue numpy structurée (sans copie) sur les enregistrements."""
+        return np.frombuffer(self.buffer, dtype=self.codec.dtype, count=self.count, offset=HEADER.size)
+
+    def columns(self) -> Dict[str, Any]:
+        """Colonnes décodées : vues numpy pour les champs numériques, listes pour les chaînes."""
+        read = self._string_reader()
+        array = self.array()
+        result = {}
+        for f in self.codec.fields:
+            if f.name in self.codec.pointer_fields:
+                result[f.name] = [read(int(p)) for p in array[f.name]]
+            else:
+                result[f.name] = array[f.name]
+        return result
+
+    def as_ctypes(self) -> ctypes.Array:
+        """
+        Tableau ctypes partageant la mémoire du buffer (from_buffer, sans copie).
+        Les offsets des chaînes sont relocalisés en adresses absolues à la
+        première utilisation. Un buffer en lecture seule (ex. segment partagé
+        entre processus) est d'abord copié : la source n'est jamais modifiée.
+        """
+        if memoryview(self.buffer).readonly:
+            self.buffer = bytearray(self.buffer)
+        base = self._base_address()
+        array = (self.codec.struct_type * self.count).from_buffer(memoryview(self.buffer), HEADER.size)
+        if not self.flags & FLAG_RELOCATED:
+            records = self.array()
+            for name in self.codec.pointer_fields:
+                offsets = records[name]
+                records[name] = np.where(offsets != 0, offsets + base, 0)
+            self.flags |= FLAG_RELOCATED
+            HEADER.pack_into(self.buffer, 0, MAGIC, self.flags, self.count)
+        return array
+
+    def tobytes(self) -> bytes:
+        """Copie portable du buffer (offsets relatifs, transmissible entre services)."""
+        data = bytearray(self.buffer)
+        if self.flags & FLAG_RELOCATED:
+            base = self._base_address()
+            records = np.frombuffer(data, dtype=self.codec.dtype, count=self.count, offset=HEADER.size)
+            for name in self.codec.pointer_fields:
+                pointers = records[name]
+                records[name] = np.where(pointers != 0, pointers - base, 0)
+            del records
+            HEADER.pack_into(data, 0, MAGIC, self.flags & ~FLAG_RELOCATED, self.count)
+        return bytes(data)
+
+
+# Adaptateurs génériques liés à chaque sous-classe de PackedStructData :
+# (from_type, to_type, classe, cost, fidelity), PackedStructData servant de marqueur.
+_PACKED_ADAPTERS: List[Tuple[Type, Type, Type, int, str]] = []
+
+
+def _bind(packed_cls: Type[PackedStructData], template: Tuple[Type, Type, Type, int, str]) -> None:
+    from_type, to_type, cls, cost, fidelity = template
+    bound = type(f"{cls.__name__}[{packed_cls.metadata.name}]", (cls,), {'packed_type': packed_cls})
+    register_adapter(
+        packed_cls if from_type is PackedStructData else from_type,
+        packed_cls if to_type is PackedStructData else to_type,
+        cost=cost, fidelity=fidelity,
+    )(bound)
+
+
+def register_packed_adapter(from_type, to_type, cost=1, fidelity='high'):
+    """
+    Enregistre un adaptateur pour toutes les sous-classes de PackedStructData.
+    PackedStructData (en source ou en cible) désigne la sous-classe liée, exposée
+    à l'adaptateur via l'attribut packed_type. Un adaptateur dont la source est
+    PackedStructData est aussi enregistré pour la classe de base.
+    """
+    def decorator(cls):
+        template = (from_type, to_type, cls, cost, fidelity)
+        with PackedStructFactory._lock:
+            _PACKED_ADAPTERS.append(template)
+            existing = [packed_cls for _, packed_cls in PackedStructFactory._types.values()]
+        if from_type is PackedStructData:
+            register_adapter(from_type, to_type, cost=cost, fidelity=fidelity)(cls)
+        for packed_cls in existing:
+            _bind(packed_cls, template)
+        return cls
+    return decorator
+
+
+class PackedStructFactory:
+    """
+    Fabrique des codecs et des sous-classes PackedStructData par structure.
+    Même principe que DynamicStructureFactory : caches indexés par
+    (nom, version), publiés en copy-on-write.
+    """
+    _codecs: Dict[Tuple[str, str], Tuple[StructureMetadata, StructCodec]] = {}
+    _types: Dict[Tuple[str, str], Tuple[StructureMetadata, Type[PackedStructData]]] = {}
+    _lock = threading.RLock()
+
+    @classmethod
+    def codec(cls, metadata: StructureMetadata) -> StructCodec:
+        key = (metadata.name, metadata.version)
+        entry = cls._codecs.get(key)
+        if entry is not None and entry[0] is metadata:
+            return entry[1]
+        with cls._lock:
+            entry = cls._codecs.get(key)
+            if entry is None or entry[0] is not metadata:
+                entry = (metadata, StructCodec(metadata))
+                cls._codecs = {**cls._codecs, key: entry}
+        return entry[1]
+
+    @classmethod
+    def create_type(cls, metadata: StructureMetadata) -> Type[PackedStructData]:
+        key = (metadata.name, metadata.version)
+        entry = cls._types.get(key)
+        if entry is not None and entry[0] is metadata:
+            return entry[1]
+        with cls._lock:
+            entry = cls._types.get(key)
+            if entry is None or entry[0] is not metadata:
+                packed_cls = type(f"Packed{metadata.name}", (PackedStructData,), {'metadata': metadata})
+                entry = (metadata, packed_cls)
+                cls._types = {**cls._types, key: entry}
+                templates = list(_PACKED_ADAPTERS)
+            else:
+                templates = []
+        for template in templates:
+            _bind(entry[1], template)
+        return entry[1]
@@ -0,0 +1,155 @@
+# chimere/profiling.py
+"""Module EXPLAIN / EXPLAIN ANALYZE des conversions."""
+import cProfile
+import io
+import pstats
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+from .core import DEFAULT_ALTERNATIVES, _apply, _next_step, _resolve_routes, get_snapshot
+from .optimizer import remove_round_trips
+from .memory import estimate_size, traced_memory
+
+
+@dataclass
+class HopProfile:
+    """Description (et mesures si analyze=True) d'une étape de conversion."""
+    adapter: str
+    from_type: str
+    to_type: str
+    cost: int
+    fidelity: str
+    wall_time: Optional[float] = None
+    cpu_time: Optional[float] = None
+    input_size: Optional[int] = None
+    output_size: Optional[int] = None
+    peak_alloc: Optional[int] = None
+    profile: Optional[str] = None
+
+    def as_row(self) -> Dict[str, Any]:
+        return {
+            'adapter': self.adapter,
+            'from': self.from_type,
+            'to': self.to_type,
+            'cost': self.cost,
+            'fidelity': self.fidelity,
+            'wall_ms': None if self.wall_time is None else round(self.wall_time * 1000, 3),
+            'cpu_ms': None if self.cpu_time is None else round(self.cpu_time * 1000, 3),
+            'in_bytes': self.input_size,
+            'out_bytes': self.output_size,
+            'peak_bytes': self.peak_alloc,
+        }
+
+
+@dataclass
+class ConversionExplanation:
+    """Plan de conversion choisi, alternatives considérées et mesures par étape."""
+    source: type
+    target: type
+    path: List[type]
+    cost: int
+    alternatives: List[Tuple[int, List[type]]] = field(default_factory=list)
+    hops: List[HopProfile] = field(default_factory=list)
+    analyzed: bool = False
+    result: Any = None
+
+    def rows(self) -> List[Dict[str, Any]]:
+        """Une ligne par étape, prête à être affichée sous forme de tableau."""
+        return [hop.as_row() for hop in self.hops]
+
+    def to_table(self) -> str:
+        rows = self.rows()
+        columns = list(rows[0]) if rows else list(HopProfile('', '', '', 0, '').as_row())
+        if not self.analyzed:
+            columns = columns[:5]
+        cells = [[str(row[c]) if row[c] is not None else '-' for c in columns] for row in rows]
+        widths = [max([len(c)] + [len(r[i]) for r in cells]) for i, c in enumerate(columns)]
+        lines = [
+            f"{self.source.__name__} -> {self.target.__name__} (cost={self.cost})",
+            '  '.join(c.ljust(w) for c, w in zip(columns, widths)),
+            '  '.join('-' * w for w in widths),
+        ]
+        lines += ['  '.join(v.ljust(w) for v, w in zip(r, widths)) for r in cells]
+        for cost, path in self.alternatives:
+            lines.append(f"alternative (cost={cost}): {' -> '.join(t.__name__ for t in path)}")
+        return '\n'.join(lines)
+
+    def __str__(self) -> str:
+        return self.to_table()
+
+
+def _profile_text(profiler: cProfile.Profile, limit: int = 15) -> str:
+    output = io.StringIO()
+    pstats.Stats(profiler, stream=output).sort_stats('cumulative').print_stats(limit)
+    return output.getvalue()
+
+
+def explain(obj, target_type, analyze=False, profile=False, constraints=None,
+            alternatives=DEFAULT_ALTERNATIVES, optimize=True) -> ConversionExplanation:
+    """
+    Décrit la conversion de obj vers target_type : chemin choisi, coût estimé
+    et alternatives considérées.
+    analyze: exécute le chemin et mesure par étape temps mur/CPU, tailles
+             d'entrée/sortie et pic d'allocation tracemalloc
+    profile: avec analyze, capture un profil cProfile par adaptateur
+    optimize: décrit le plan après fusion des étapes (comme convert)
+    obj peut être un type lorsque analyze est False.
+    """
+    if analyze and isinstance(obj, type):
+        raise ValueError("explain(analyze=True) nécessite un objet à convertir")
+    from_type = obj if isinstance(obj, type) else type(obj)
+    snapshot = get_snapshot()
+    routes = _resolve_routes(from_type, target_type, alternatives, constraints, snapshot)
+    if not routes:
+        raise ValueError(f"Aucun chemin de conversion trouvé entre {from_type.__name__} et {target_type.__name__}")
+
+    cost, path = routes[0]
+    if optimize:
+        path = remove_round_trips(snapshot, path)
+    explanation = ConversionExplanation(
+        source=from_type, target=target_type, path=list(path), cost=cost,
+        alternatives=routes[1:], analyzed=analyze,
+    )
+    steps = []
+    i = 0
+    while i < len(path) - 1:
+        end, info = _next_step(snapshot, path, i, optimize)
+        steps.append(info)
+        explanation.hops.append(HopProfile(
+            adapter=info['class'].__name__,
+            from_type=path[i].__name__,
+            to_type=path[end].__name__,
+            cost=info['cost'],
+            fidelity=info['fidelity'],
+        ))
+        i = end
+    # Un aller-retour supprimé ne compte plus dans le coût
+    explanation.cost = sum(hop.cost for hop in explanation.hops)
+    if not analyze:
+        return explanation
+
+    current_obj = obj
+    with traced_memory() as tracer:
+        for i, hop in enumerate(explanation.hops):
+            hop.input_size = estimate_size(current_obj)
+            profiler = cProfile.Profile() if profile else None
+            tracer.reset_peak()
+            baseline = tracer.current()
+            wall_start = time.perf_counter()
+            cpu_start = time.process_time()
+            if profiler is not None:
+                profiler.enable()
+            try:
+                current_obj = _apply(steps[i], current_obj)
+            finally:
+                if profiler is not None:
+                    profiler.disable()
+            hop.cpu_time = time.process_time() - cpu_start
+            hop.wall_time = time.perf_counter() - wall_start
+            hop.peak_alloc = max(tracer.peak() - baseline, 0)
+            hop.output_size = estimate_size(current_obj)
+            if profiler is not None:
+                hop.profile = _profile_text(profiler)
+    explanation.result = current_obj
+    return explanation
@@ -1,23 +1,115 @@
 # Registry des adaptateurs
+import threading
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from types import MappingProxyType
+
+
+@dataclass(frozen=True)
+class RegistrySnapshot:
+    """
+    Vue immuable et versionnée du registre des adaptateurs.
+    Les lecteurs prennent le snapshot courant sans verrou ; chaque
+    enregistrement publie un nouveau snapshot (copy-on-write).
+    """
+    version: int
+    adapters: Mapping = field(default_factory=lambda: MappingProxyType({}))
+    # Index des arêtes sortantes : successors[from_type] = ((to_type, info), ...)
+    successors: Mapping = field(default_factory=lambda: MappingProxyType({}))
+    # Index des arêtes entrantes : predecessors[to_type] = ((from_type, info), ...)
+    predecessors: Mapping = field(default_factory=lambda: MappingProxyType({}))
+    # Arêtes modifiées depuis la version précédente : ((from, to, old_info, new_info), ...)
+    delta: tuple = ()
+
+    def get(self, key, default=None):
+        return self.adapters.get(key, default)
+
+
+_LOCK = threading.Lock()
+_SNAPSHOT = RegistrySnapshot(version=0)
+_LISTENERS = []
+
+
+def get_snapshot() -> RegistrySnapshot:
+    """Retourne le snapshot courant du registre (lecture sans verrou)."""
+    return _SNAPSHOT
+
+
+class _AdaptersView(Mapping):
+    """Vue en lecture seule sur les adaptateurs du snapshot courant."""
+
+    def __getitem__(self, key):
+        return _SNAPSHOT.adapters[key]
+
+    def __iter__(self):
+        return iter(_SNAPSHOT.adapters)
+
+    def __len__(self):
+        return len(_SNAPSHOT.adapters)
+
+    def __repr__(self):
+        return f"ADAPTERS(version={_SNAPSHOT.version}, {dict(_SNAPSHOT.adapters)!r})"
+
+
+ADAPTERS = _AdaptersView()  # Clé: (from_type, to_type) ; Valeur: {class, cost, fidelity, pre_validation}
+
+
+def add_listener(callback):
+    """
+    Abonne callback(old_snapshot, new_snapshot) aux mises à jour du registre.
+    Le callback est appelé sous le verrou d'enregistrement, avant la
+    publication du nouveau snapshot.
+    """
+    with _LOCK:
+        _LISTENERS.append(callback)
+    return callback
+
+
+def _publish(adapters, delta):
+    """Construit et publie un nouveau snapshot. Doit être appelé sous _LOCK."""
+    global _SNAPSHOT
+    successors = {}
+    predecessors = {}
+    for (f, t), info in adapters.items():
+        successors.setdefault(f, []).append((t, info))
+        predecessors.setdefault(t, []).append((f, info))
+    old = _SNAPSHOT
+    new = RegistrySnapshot(
+        version=old.version + 1,
+        adapters=MappingProxyType(adapters),
+        successors=MappingProxyType({f: tuple(edges) for f, edges in successors.items()}),
+        predecessors=MappingProxyType({t: tuple(edges) for t, edges in predecessors.items()}),
+        delta=tuple(delta),
+    )
+    for callback in _LISTENERS:
+        callback(old, new)
+    _SNAPSHOT = new
+    return new
 
-ADAPTERS = {}  # Clé: (from_type, to_type) ; Valeur: (AdapterClass, cost, fidelity, validations)
 
 def register_adapter(from_type, to_type, cost=1, fidelity='high'):
     """
     Enregistre un adaptateur avec métadonnées optionnelles.
     cost: entier indiquant le "coût" de la conversion (1 par défaut)
     fidelity: string décrivant la fidélité ('high', 'medium', 'low')
+    Une classe avec first_hop_only = True n'est utilisée qu'en premier saut
+    d'une route (depuis l'objet fourni par l'appelant).
     """
     def decorator(cls):
         validations = None
         if hasattr(cls, 'validate_input'):
             validations = cls.validate_input
-        ADAPTERS[(from_type, to_type)] = {
+        info = MappingProxyType({
             'class': cls,
             'cost': cost,
             'fidelity': fidelity,
             'pre_validation': validations
-        }
+        })
+        with _LOCK:
+            adapters = dict(_SNAPSHOT.adapters)
+            old_info = adapters.get((from_type, to_type))
+            adapters[(from_type, to_type)] = info
+            _publish(adapters, [(from_type, to_type, old_info, info)])
         return cls
     return decorator
 
@@ -0,0 +1,261 @@
+# chimere/shared.py
+"""Module de représentation en mémoire partagée entre processus."""
+import json
+import logging
+import struct
+import weakref
+from multiprocessing import shared_memory
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from .exceptions import ValidationError
+from .types import BaseRepresentation
+
+logger = logging.getLogger(__name__)
+
+# En-tête : magic, version du format, taille du manifeste JSON
+HEADER = struct.Struct('<4sIQ')
+MAGIC = b'CHSM'
+FORMAT_VERSION = 1
+ALIGNMENT = 64
+
+# Types numpy copiés tels quels (lus sans copie à l'attachement)
+_RAW_KINDS = 'biufcmM'
+# Types nullables pandas : valeurs numpy plus masque de validité
+_MASKED_ARRAYS = (pd.arrays.IntegerArray, pd.arrays.FloatingArray, pd.arrays.BooleanArray)
+
+
+def _align(offset: int) -> int:
+    return (offset + ALIGNMENT - 1) // ALIGNMENT * ALIGNMENT
+
+
+def _open_segment(name: str) -> shared_memory.SharedMemory:
+    """
+    S'attache à un segment existant sans l'inscrire au resource tracker :
+    seul le processus créateur doit pouvoir le détruire.
+    """
+    try:
+        return shared_memory.SharedMemory(name=name, track=False)
+    except TypeError:  # Python < 3.13
+        shm = shared_memory.SharedMemory(name=name)
+        try:
+            from multiprocessing import resource_tracker
+            resource_tracker.unregister(shm._name, 'shared_memory')
+        except (ImportError, AttributeError, KeyError):  # pragma: no cover - Windows
+            pass
+        return shm
+
+
+# Segments dont la fermeture a été différée (vues encore exportées)
+_PENDING: List[shared_memory.SharedMemory] = []
+
+
+def _close(shm: shared_memory.SharedMemory) -> bool:
+    try:
+        shm.close()
+        return True
+    except BufferError:
+        return False
+
+
+def _release(shm: shared_memory.SharedMemory, unlink: bool) -> None:
+    _PENDING[:] = [pending for pending in _PENDING if not _close(pending)]
+    if not _close(shm):
+        # Des vues numpy existent encore : nouvelle tentative au prochain appel
+        logger.debug(f"Segment {shm.name} encore référencé, fermeture différée")
+        _PENDING.append(shm)
+    if unlink:
+        try:
+            shm.unlink()
+        except FileNotFoundError:
+            pass
+
+
+class SharedMemoryData(BaseRepresentation):
+    """
+    Données stockées dans un segment multiprocessing.shared_memory.
+    Le segment contient un en-tête, un manifeste JSON décrivant le contenu,
+    puis les buffers de données alignés sur 64 octets. Un autre processus
+    n'a besoin que du nom du segment pour s'y attacher (SharedMemoryData.attach).
+
+    Le processus créateur est propriétaire du segment : il est détruit
+    (unlink) par close(), à la sortie d'un bloc with, ou à la collecte de
+    l'objet. Les processus attachés ne font que fermer leur mapping.
+    """
+
+    def __init__(self, shm: shared_memory.SharedMemory, manifest: Dict[str, Any], owner: bool) -> None:
+        self.shm = shm
+        self.manifest = manifest
+        self.owner = owner
+        self._finalizer = weakref.finalize(self, _release, shm, owner)
+
+    @property
+    def name(self) -> str:
+        return self.shm.name
+
+    @classmethod
+    def create(cls, manifest: Dict[str, Any], data_size: int) -> 'SharedMemoryData':
+        """Crée un segment contenant le manifeste ; les données commencent à manifest['data_offset']."""
+        manifest = dict(manifest)
+        # La taille du manifeste dépend de data_offset : on itère jusqu'à stabilité
+        data_offset = 0
+        while True:
+            manifest['data_offset'] = data_offset
+            encoded = json.dumps(manifest).encode('utf-8')
+            needed = _align(HEADER.size + len(encoded))
+            if needed == data_offset:
+                break
+            data_offset = needed
+        shm = shared_memory.SharedMemory(create=True, size=max(data_offset + data_size, 1))
+        HEADER.pack_into(shm.buf, 0, MAGIC, FORMAT_VERSION, len(encoded))
+        shm.buf[HEADER.size:HEADER.size + len(encoded)] = encoded
+        return cls(shm, manifest, owner=True)
+
+    @classmethod
+    def attach(cls, name: str) -> 'SharedMemoryData':
+        """S'attache à un segment créé par un autre processus."""
+        shm = _open_segment(name)
+        magic, version, length = HEADER.unpack_from(shm.buf, 0)
+        if magic != MAGIC or version != FORMAT_VERSION:
+            shm.close()
+            raise ValidationError(f"Segment {name} n'est pas un segment chimere valide")
+        manifest = json.loads(bytes(shm.buf[HEADER.size:HEADER.size + length]))
+        return cls(shm, manifest, owner=False)
+
+    def view(self, offset: int, nbytes: int) -> memoryview:
+        """Vue sans copie sur une zone de données (offset relatif aux données)."""
+        start = self.manifest['data_offset'] + offset
+        return self.shm.buf[start:start + nbytes]
+
+    def close(self) -> None:
+        """Ferme le mapping (et détruit le segment si ce processus en est propriétaire)."""
+        self._finalizer()
+
+    def __enter__(self) -> 'SharedMemoryData':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def __reduce__(self):
+        # Transmis entre processus par son nom uniquement
+        return (SharedMemoryData.attach, (self.name,))
+
+
+def dataframe_to_shared(df: pd.DataFrame) -> SharedMemoryData:
+    """Copie un DataFrame dans un nouveau segment (une seule copie des données)."""
+    columns: List[Dict[str, Any]] = []
+    arrays = []
+    size = 0
+    for name in df.columns:
+        if not isinstance(name, str):
+            raise ValidationError(f"Nom de colonne non supporté en mémoire partagée: {name!r}")
+        series = df[name]
+        if isinstance(series.array, _MASKED_ARRAYS):
+            # Int64, Float64, boolean : les NA sont conservés par un masque
+            numpy_dtype = series.dtype.numpy_dtype
+            values = np.ascontiguousarray(series.to_numpy(dtype=numpy_dtype, na_value=numpy_dtype.type(0)))
+            valid = ~series.isna().to_numpy()
+            column = {'name': name, 'kind': 'masked', 'dtype': values.dtype.str, 'extension': series.dtype.name}
+            for part, array in (('values', values), ('valid', valid)):
+                column[f'{part}_offset'] = size
+                column[f'{part}_nbytes'] = array.nbytes
+                arrays.append((size, array))
+                size = _align(size + array.nbytes)
+            columns.append(column)
+            continue
+        if series.dtype.kind in _RAW_KINDS and not isinstance(series.dtype, pd.CategoricalDtype):
+            array = np.ascontiguousarray(series.to_numpy())
+            if array.dtype.kind not in _RAW_KINDS:
+                # ex. datetime avec fuseau horaire : tableau d'objets Timestamp
+                raise ValidationError(
+                    f"Type non supporté en mémoire partagée pour la colonne {name}: {series.dtype}"
+                )
+            columns.append({'name': name, 'kind': 'raw', 'dtype': array.dtype.str,
+                            'offset': size, 'nbytes': array.nbytes})
+            arrays.append((size, array))
+            size = _align(size + array.nbytes)
+            continue
+        # Chaînes : buffer d'offsets (n + 1), buffer de données UTF-8 et masque de validité
+        values = series.to_numpy(dtype=object)
+        valid = np.fromiter((isinstance(v, str) for v in values), dtype=np.bool_, count=len(values))
+        for v, ok in zip(values, valid):
+            if not ok and not pd.isna(v):
+                raise ValidationError(f"Valeur non supportée dans la colonne {name}: {type(v)}")
+        encoded = [v.encode('utf-8') if ok else b'' for v, ok in zip(values, valid)]
+        offsets = np.zeros(len(encoded) + 1, dtype='<i8')
+        np.cumsum([len(b) for b in encoded], out=offsets[1:])
+        data = np.frombuffer(b''.join(encoded), dtype=np.uint8)
+        column = {'name': name, 'kind': 'string'}
+        for part, array in (('offsets', offsets), ('data', data), ('valid', valid)):
+            column[f'{part}_offset'] = size
+            column[f'{part}_nbytes'] = array.nbytes
+            arrays.append((size, array))
+            size = _align(size + array.nbytes)
+        columns.append(column)
+
+    shared = SharedMemoryData.create({'kind': 'dataframe', 'rows': len(df), 'columns': columns}, size)
+    for offset, array in arrays:
+        shared.view(offset, array.nbytes)[:] = array.view(np.uint8).reshape(-1)
+    return shared
+
+
+def shared_to_dataframe(shared: SharedMemoryData) -> pd.DataFrame:
+    """
+    Reconstruit le DataFrame : les colonnes numériques (et les valeurs des
+    colonnes nullables) sont des vues sur le segment (sans copie), les
+    chaînes sont décodées.
+    """
+    manifest = shared.manifest
+    if manifest.get('kind') != 'dataframe':
+        raise ValidationError(f"Le segment {shared.name} ne contient pas de DataFrame")
+    rows = manifest['rows']
+    data = {}
+    for column in manifest['columns']:
+        if column['kind'] == 'raw':
+            data[column['name']] = np.frombuffer(
+                shared.view(column['offset'], column['nbytes']), dtype=np.dtype(column['dtype']), count=rows
+            )
+            continue
+        if column['kind'] == 'masked':
+            values = np.frombuffer(
+                shared.view(column['values_offset'], column['values_nbytes']),
+                dtype=np.dtype(column['dtype']), count=rows,
+            )
+            valid = np.frombuffer(shared.view(column['valid_offset'], column['valid_nbytes']), dtype=np.bool_)
+            array_type = pd.api.types.pandas_dtype(column['extension']).construct_array_type()
+            data[column['name']] = array_type(values, ~valid, copy=False)
+            continue
+        offsets = np.frombuffer(shared.view(column['offsets_offset'], column['offsets_nbytes']), dtype='<i8')
+        raw = bytes(shared.view(column['data_offset'], column['data_nbytes']))
+        valid = np.frombuffer(shared.view(column['valid_offset'], column['valid_nbytes']), dtype=np.bool_)
+        data[column['name']] = [
+            raw[offsets[i]:offsets[i + 1]].decode('utf-8') if valid[i] else None
+            for i in range(rows)
+        ]
+    return pd.DataFrame(data, copy=False)
+
+
+def packed_to_shared(buffer: Any, structure: str, version: str) -> SharedMemoryData:
+    """Copie un buffer PackedStructData dans un nouveau segment."""
+    view = memoryview(buffer).cast('B')
+    shared = SharedMemoryData.create(
+        {'kind': 'packed', 'structure': structure, 'version': version, 'nbytes': view.nbytes},
+        view.nbytes,
+    )
+    shared.view(0, view.nbytes)[:] = view
+    return shared
+
+
+def shared_packed_view(shared: SharedMemoryData, structure: Optional[str] = None) -> memoryview:
+    """Vue sans copie sur le buffer packed stocké dans le segment."""
+    manifest = shared.manifest
+    if manifest.get('kind') != 'packed':
+        raise ValidationError(f"Le segment {shared.name} ne contient pas de structures packed")
+    if structure is not None and manifest['structure'] != structure:
+        raise ValidationError(
+            f"Le segment contient {manifest['structure']}, {structure} attendu"
+        )
+    return shared.view(0, manifest['nbytes'])
@@ -0,0 +1,169 @@
+# chimere/singleflight.py
+"""Module de coalescence des conversions identiques simultanées (single-flight)."""
+import hashlib
+import os
+import pickle
+import threading
+from concurrent.futures import Future
+from dataclasses import dataclass
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+import pandas as pd
+
+from .types import PandasDataFrameData, PythonDictData, TextRepresentation
+
+COALESCE_MODES = ('identity', 'content')
+
+
+@dataclass
+class SingleFlightStats:
+    """executions : conversions réellement exécutées ; coalesced : appels servis par une exécution en cours."""
+    executions: int = 0
+    coalesced: int = 0
+    failures: int = 0
+
+
+class SingleFlight:
+    """
+    Regroupe les appels concurrents portant la même clé : le premier exécute
+    la conversion, les suivants attendent son résultat (ou son erreur).
+    Le résultat est partagé : tous les appelants reçoivent le même objet.
+    """
+
+    def __init__(self) -> None:
+        self.stats = SingleFlightStats()
+        self._flights: Dict[Hashable, Future] = {}
+        # Appelants qui attendent encore chaque exécution (exécutant compris)
+        self._waiters: Dict[Future, int] = {}
+        self._lock = threading.Lock()
+
+    def acquire(self, key: Hashable) -> Tuple[Future, bool]:
+        """
+        Retourne (future de l'exécution, True si l'appelant doit l'exécuter).
+        L'appelant compte parmi les attentes de l'exécution jusqu'à leave().
+        """
+        with self._lock:
+            future = self._flights.get(key)
+            if future is not None:
+                self.stats.coalesced += 1
+                self._waiters[future] += 1
+                return future, False
+            future = self._flights[key] = Future()
+            self._waiters[future] = 1
+            self.stats.executions += 1
+            return future, True
+
+    def leave(self, key: Hashable, future: Future) -> bool:
+        """
+        L'appelant n'attend plus l'exécution (résultat reçu, délai dépassé ou
+        annulation). Retourne True s'il était le dernier : une exécution encore
+        en cours peut alors être abandonnée, les appels suivants en relancent une.
+        """
+        with self._lock:
+            remaining = self._waiters.get(future, 1) - 1
+            if remaining > 0:
+                self._waiters[future] = remaining
+                return False
+            self._waiters.pop(future, None)
+            if self._flights.get(key) is future:
+                del self._flights[key]
+            return True
+
+    def release(self, key: Hashable, future: Future, result: Any = None,
+                error: Optional[BaseException] = None, cancelled: bool = False) -> None:
+        """
+        Publie le résultat de l'exécution ; les appels suivants relancent une
+        conversion. cancelled : l'exécution a été annulée (tâche asyncio),
+        les appelants en attente reçoivent une annulation.
+        """
+        with self._lock:
+            if self._flights.get(key) is future:
+                del self._flights[key]
+            if error is not None or cancelled:
+                self.stats.failures += 1
+        if cancelled:
+            future.cancel()
+        elif error is not None:
+            future.set_exception(error)
+        else:
+            future.set_result(result)
+
+    def run(self, key: Hashable, func, *args) -> Any:
+        future, leader = self.acquire(key)
+        try:
+            if not leader:
+                return future.result()
+            try:
+                result = func(*args)
+            except BaseException as e:
+                self.release(key, future, error=e)
+                raise
+            self.release(key, future, result)
+            return result
+        finally:
+            self.leave(key, future)
+
+    def in_flight(self) -> int:
+        return len(self._flights)
+
+    def reset_stats(self) -> None:
+        with self._lock:
+            self.stats = SingleFlightStats()
+
+
+SINGLE_FLIGHT = SingleFlight()
+
+
+def _digest(*parts: bytes) -> str:
+    h = hashlib.blake2b(digest_size=16)
+    for part in parts:
+        h.update(part)
+    return h.hexdigest()
+
+
+def content_key(obj: Any) -> Optional[Hashable]:
+    """
+    Empreinte du contenu de obj, ou None s'il ne peut pas être haché (la
+    coalescence se fait alors par identité).
+    Un fichier source est identifié par chemin, taille et date de
+    modification, sans être relu.
+    """
+    try:
+        if isinstance(obj, TextRepresentation):
+            path = obj.path
+            if path is not None:
+                stat = path.stat()
+                return ('file', str(path.resolve()), stat.st_size, stat.st_mtime_ns)
+            return ('text', _digest(bytes(obj.buffer())))
+        if isinstance(obj, PandasDataFrameData):
+            df = obj.df
+            rows = pd.util.hash_pandas_object(df, index=True).to_numpy()
+            meta = repr((list(df.columns), [str(t) for t in df.dtypes])).encode()
+            return ('dataframe', _digest(meta, rows.tobytes()))
+        if isinstance(obj, PythonDictData):
+            return ('dict', _digest(pickle.dumps(obj.data, protocol=pickle.HIGHEST_PROTOCOL)))
+    except (TypeError, ValueError, OSError, pickle.PicklingError):
+        return None
+    return None
+
+
+def flight_key(obj: Any, mode: Any, *params: Hashable) -> Hashable:
+    """Clé de coalescence : (identité ou empreinte de obj, type d'obj, paramètres de conversion)."""
+    if mode is True:
+        mode = 'identity'
+    if mode not in COALESCE_MODES:
+        raise ValueError(f"coalesce doit valoir True, 'identity' ou 'content', pas {mode!r}")
+    source = content_key(obj) if mode == 'content' else None
+    if source is None:
+        # obj reste référencé par l'appel en cours : son id ne peut pas être réutilisé
+        source = ('id', id(obj))
+    return (source, type(obj)) + params
+
+
+def output_key(output: Any) -> Hashable:
+    """Les sorties vers un même fichier (ou le même flux) peuvent être coalescées."""
+    if output is None:
+        return None
+    if isinstance(output, (str, os.PathLike)):
+        return ('path', os.path.abspath(os.fspath(output)))
+    return ('id', id(output))
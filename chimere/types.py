@@ -1,45 +1,318 @@
 from abc import ABC, abstractmethod
+import io
+import mmap
+import os
+import shutil
+import sys
+from pathlib import Path
+from typing import BinaryIO, Optional, Sequence, TextIO, Union
 import pandas as pd
 
 class BaseRepresentation(ABC):
     """Classe de base abstraite pour toutes les représentations de données."""
     pass
 
+# Source d'une représentation textuelle : texte décodé, octets, buffer,
+# chemin de fichier (ouvert paresseusement) ou flux binaire/texte ouvert.
+TextSource = Union[str, bytes, bytearray, memoryview, os.PathLike, BinaryIO, TextIO]
+
+
+def stream_position(stream) -> Optional[int]:
+    """Position courante d'un flux (None si elle n'est pas disponible)."""
+    try:
+        return stream.tell()
+    except (AttributeError, OSError, ValueError):
+        return None
+
+
+class WrittenStream:
+    """
+    Flux de sortie de l'appelant dans lequel un résultat a été écrit : il
+    n'est jamais relu ni repositionné (sa position et son contenu antérieur
+    appartiennent à l'appelant).
+    """
+
+    def __init__(self, stream, start: Optional[int] = None):
+        self.stream = stream
+        end = stream_position(stream)
+        # Octets (ou caractères) écrits, si le flux donne sa position
+        self.written = end - start if start is not None and end is not None else None
+
+class ConsumedStream:
+    """Flux source de l'appelant déjà lu en continu par un adaptateur (lecture unique)."""
+
+
+class _BorrowedStream(io.RawIOBase):
+    """
+    Lecture d'un flux binaire de l'appelant depuis sa position courante ;
+    close() ne ferme pas le flux emprunté.
+    """
+
+    def __init__(self, stream) -> None:
+        self._stream = stream
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, b) -> int:
+        data = self._stream.read(len(b))
+        b[:len(data)] = data
+        return len(data)
+
+
+class _BorrowedText(io.TextIOBase):
+    """Équivalent texte de _BorrowedStream."""
+
+    def __init__(self, stream) -> None:
+        self._stream = stream
+
+    def readable(self) -> bool:
+        return True
+
+    def read(self, size: Optional[int] = -1) -> str:
+        return self._stream.read(size)
+
+    def readline(self, size: Optional[int] = -1) -> str:
+        return self._stream.readline(size)
+
+
+class TextRepresentation(BaseRepresentation):
+    """
+    Base des représentations textuelles (JSON, CSV, XML).
+    Le contenu peut être un str (comportement historique), des octets
+    (bytes, bytearray, memoryview), un chemin (os.PathLike, mappé en mémoire
+    à la demande) ou un flux ouvert. Les adaptateurs lisent la source via
+    buffer()/open_binary()/open_source() sans passer par une copie str
+    intermédiaire.
+    Un flux est lu depuis sa position courante, jamais repositionné ni fermé :
+    soit en continu par open_source()/open_binary()/open_text() (lecture
+    unique), soit entièrement et une seule fois par source/content/buffer().
+    """
+    encoding = 'utf-8'
+
+    def __init__(self, content: TextSource):
+        self.content = content
+
+    @classmethod
+    def from_file(cls, path: Union[str, os.PathLike], **kwargs):
+        return cls(Path(path), **kwargs)
+
+    @classmethod
+    def written_to(cls, output, start: Optional[int] = None, **kwargs):
+        """
+        Résultat écrit dans output : un fichier est relu à la demande, un flux
+        ne l'est pas. start : position du flux avant l'écriture (pour size()).
+        """
+        if isinstance(output, (str, os.PathLike)):
+            return cls(Path(output), **kwargs)
+        return cls(WrittenStream(output, start), **kwargs)
+
+    @property
+    def content(self) -> str:
+        """Contenu décodé (lit le fichier ou décode les octets si nécessaire)."""
+        source = self._resolved()
+        if isinstance(source, str):
+            return source
+        if isinstance(source, (bytes, bytearray, memoryview)):
+            return str(source, self.encoding)
+        with self.open_text() as f:
+            return f.read()
+
+    @content.setter
+    def content(self, value: TextSource) -> None:
+        self._source = value
+        self._mmap: Optional[mmap.mmap] = None
+
+    @property
+    def source(self):
+        """Source brute : str, octets, buffer ou chemin (un flux est lu entièrement)."""
+        return self._resolved()
+
+    def _resolved(self):
+        """
+        Source courante ; un flux ouvert est lu une seule fois depuis sa
+        position courante, puis conservé tel quel (str ou octets).
+        """
+        source = self._source
+        if isinstance(source, (str, bytes, bytearray, memoryview, os.PathLike)):
+            return source
+        if isinstance(source, WrittenStream):
+            raise ValueError("Résultat écrit dans un flux de sortie : contenu non relisible (utiliser un chemin)")
+        if isinstance(source, ConsumedStream):
+            raise ValueError("Flux source déjà lu : contenu non relisible")
+        self._source = source.read()
+        return self._source
+
+    def is_stream(self) -> bool:
+        """Vrai si la source est un flux ouvert de l'appelant, pas encore lu."""
+        return not isinstance(
+            self._source, (str, bytes, bytearray, memoryview, os.PathLike, WrittenStream, ConsumedStream)
+        )
+
+    def _borrow(self):
+        stream = self._source
+        self._source = ConsumedStream()
+        return stream
+
+    @property
+    def path(self) -> Optional[Path]:
+        """Chemin du fichier source, ou None si le contenu est en mémoire."""
+        return Path(self._source) if isinstance(self._source, os.PathLike) else None
+
+    def is_in_memory(self) -> bool:
+        return self.path is None and not isinstance(self._source, WrittenStream)
+
+    def size(self) -> int:
+        """Taille du contenu en octets (sans lire un fichier source)."""
+        if isinstance(self._source, WrittenStream):
+            return self._source.written or 0
+        source = self._resolved()
+        if isinstance(source, str):
+            return len(source) if source.isascii() else len(source.encode(self.encoding))
+        if isinstance(source, memoryview):
+            return source.nbytes
+        if isinstance(source, (bytes, bytearray)):
+            return len(source)
+        return os.stat(source).st_size
+
+    def memory_size(self) -> int:
+        """Empreinte mémoire du contenu (0 pour un fichier ou un flux non lu)."""
+        source = self._source
+        if isinstance(source, memoryview):
+            return source.nbytes
+        if isinstance(source, (str, bytes, bytearray)):
+            return sys.getsizeof(source)
+        return 0
+
+    def buffer(self):
+        """
+        Contenu sous forme d'objet bytes-like : les octets fournis tels quels,
+        ou un mmap en lecture seule pour un fichier (sans copie).
+        """
+        source = self._resolved()
+        if isinstance(source, str):
+            return source.encode(self.encoding)
+        if isinstance(source, (bytes, bytearray, memoryview)):
+            return source
+        if self._mmap is None or self._mmap.closed:
+            with open(source, 'rb') as f:
+                if os.fstat(f.fileno()).st_size == 0:
+                    return b''
+                self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        return self._mmap
+
+    def open_binary(self) -> BinaryIO:
+        """
+        Flux binaire sur le contenu (fichier ouvert directement s'il y a lieu,
+        flux binaire de l'appelant lu en continu).
+        """
+        if self.is_stream() and not isinstance(self._source, io.TextIOBase):
+            return io.BufferedReader(_BorrowedStream(self._borrow()))
+        source = self._resolved()
+        if self.path is not None:
+            return open(source, 'rb')
+        return io.BytesIO(self.buffer())
+
+    def open_text(self) -> TextIO:
+        """Flux texte sur le contenu (flux texte de l'appelant lu en continu)."""
+        if self.is_stream() and isinstance(self._source, io.TextIOBase):
+            return _BorrowedText(self._borrow())
+        if self.is_stream():
+            return io.TextIOWrapper(self.open_binary(), encoding=self.encoding, newline='')
+        source = self._resolved()
+        if isinstance(source, str):
+            return io.StringIO(source)
+        if self.path is not None:
+            return open(source, encoding=self.encoding, newline='')
+        return io.TextIOWrapper(self.open_binary(), encoding=self.encoding, newline='')
+
+    def open_source(self) -> Union[BinaryIO, TextIO]:
+        """Flux sur la source sous sa forme d'origine : texte pour un str ou un flux texte, binaire sinon."""
+        if isinstance(self._source, (str, io.TextIOBase)):
+            return self.open_text()
+        return self.open_binary()
+
+    def write_to(self, target: Union[str, os.PathLike, BinaryIO, TextIO]) -> None:
+        """Écrit le contenu dans un fichier (chemin) ou un flux, par blocs."""
+        if isinstance(target, (str, os.PathLike)):
+            with open(target, 'wb') as out:
+                self.write_to(out)
+            return
+        if isinstance(target, io.TextIOBase):
+            with self.open_text() as f:
+                shutil.copyfileobj(f, target)
+        elif self.path is not None or self.is_stream():
+            with self.open_binary() as f:
+                shutil.copyfileobj(f, target)
+        else:
+            target.write(self.buffer())
+
+    def close(self) -> None:
+        """Libère le mmap éventuellement ouvert sur le fichier source."""
+        if self._mmap is not None and not self._mmap.closed:
+            self._mmap.close()
+        self._mmap = None
+
 class ERRORData(BaseRepresentation):
     def __init__(self, content: str):
         self.content = content
 
-class JSONData(BaseRepresentation):
-    def __init__(self, content: str):
+class JSONData(TextRepresentation):
+    def __init__(self, content: TextSource):
         """
-        content: string contenant un JSON, ex: '{"key": "value"}'
+        content: string contenant un JSON, ex: '{"key": "value"}',
+                 ou octets, buffer, chemin (Path) ou flux
         """
-        self.content = content
+        super().__init__(content)
 
-class CSVData(BaseRepresentation):
-    def __init__(self, content: str):
+class CSVData(TextRepresentation):
+    def __init__(self, content: TextSource, schema=None):
         """
-        content: string CSV, ex: "col1,col2\nval1,val2"
+        content: string CSV, ex: "col1,col2\nval1,val2",
+                 ou octets, buffer, chemin (Path) ou flux
+        schema: types des colonnes (dict nom -> dtype ou CSVSchema), optionnel
         """
-        self.content = content
+        super().__init__(content)
+        self.schema = schema
+
+class JSONLinesData(TextRepresentation):
+    def __init__(self, content: TextSource, errors: str = 'raise', workers: Optional[int] = None):
+        """
+        content: JSON délimité par des sauts de ligne (un document par ligne),
+                 en string, octets, buffer, chemin (Path) ou flux
+        errors: 'raise' (une ligne invalide fait échouer la conversion) ou
+                'skip' (les lignes invalides sont ignorées et signalées)
+        workers: nombre de processus de parsing (défaut : voir chimere.jsonlines)
+        """
+        if errors not in ('raise', 'skip'):
+            raise ValueError(f"errors doit valoir 'raise' ou 'skip', pas {errors!r}")
+        super().__init__(content)
+        self.errors = errors
+        self.workers = workers
 
 class PythonDictData(BaseRepresentation):
-    def __init__(self, data: dict):
+    def __init__(self, data: dict, bad_lines: Sequence = ()):
         """
         data: un dictionnaire Python, ex: {"name": "Alice", "age": 30}
+        bad_lines: lignes ignorées à la lecture d'un JSON Lines en mode
+                   errors='skip' (chimere.jsonlines.BadLine)
         """
         self.data = data
+        self.bad_lines = tuple(bad_lines)
 
 class PandasDataFrameData(BaseRepresentation):
-    def __init__(self, df: pd.DataFrame):
+    def __init__(self, df: pd.DataFrame, bad_lines: Sequence = ()):
         """
         df: un objet pandas DataFrame
+        bad_lines: lignes ignorées à la lecture d'un JSON Lines en mode
+                   errors='skip' (chimere.jsonlines.BadLine)
         """
         self.df = df
+        self.bad_lines = tuple(bad_lines)
 
-class XMLData(BaseRepresentation):
-    def __init__(self, content: str):
-        self.content = content
+class XMLData(TextRepresentation):
+    def __init__(self, content: TextSource):
+        super().__init__(content)
 
 class ParquetData(BaseRepresentation):
     def __init__(self, path: str):
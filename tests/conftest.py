@@ -0,0 +1,19 @@
+import pytest
+
+from chimere.types import BaseRepresentation
+
+
+@pytest.fixture
+def make_types():
+    """Fabrique de représentations vides (une classe par nom)."""
+    def make(*names):
+        return [type(name, (BaseRepresentation,), {}) for name in names]
+    return make
+
+
+@pytest.fixture
+def adapter_to():
+    """Fabrique d'adaptateurs renvoyant une instance vide de target."""
+    def make(target):
+        return type(f"To{target.__name__}", (), {"convert": lambda self, obj: target()})
+    return make
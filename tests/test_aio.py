@@ -0,0 +1,83 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from chimere import aio
+from chimere.registry import register_adapter
+from chimere.types import JSONData, CSVData
+
+
+@pytest.fixture(autouse=True)
+def reset_settings():
+    yield
+    aio.configure()
+
+
+def test_convert_async_and_many():
+    async def main():
+        single = await aio.convert_async(JSONData('{"name": "Bob", "age": 25}'), CSVData)
+        many = await aio.convert_many([JSONData('{"age": %d}' % i) for i in range(10)], CSVData)
+        return single, many
+
+    single, many = asyncio.run(main())
+    assert "Bob" in single.content
+    assert [r.content.splitlines()[1] for r in many] == [str(i) for i in range(10)]
+
+
+def test_native_async_adapter(make_types):
+    A, B = make_types("A", "B")
+
+    @register_adapter(A, B)
+    class AsyncAdapter:
+        async def convert(self, obj):
+            await asyncio.sleep(0)
+            return B()
+
+    assert isinstance(asyncio.run(aio.convert_async(A(), B)), B)
+
+
+def test_timeout_stops_between_hops(make_types):
+    A, B, C = make_types("A", "B", "C")
+    calls = []
+
+    @register_adapter(A, B)
+    class Slow:
+        def convert(self, obj):
+            time.sleep(0.2)
+            calls.append("B")
+            return B()
+
+    @register_adapter(B, C)
+    class Next:
+        def convert(self, obj):
+            calls.append("C")
+            return C()
+
+    with pytest.raises(asyncio.TimeoutError):
+        asyncio.run(aio.convert_async(A(), C, timeout=0.05))
+    time.sleep(0.3)
+    assert calls == ["B"]
+
+
+def test_max_concurrency(make_types):
+    A, B = make_types("A", "B")
+    lock = threading.Lock()
+    state = {"running": 0, "max": 0}
+
+    @register_adapter(A, B)
+    class Tracked:
+        def convert(self, obj):
+            with lock:
+                state["running"] += 1
+                state["max"] = max(state["max"], state["running"])
+            time.sleep(0.01)
+            with lock:
+                state["running"] -= 1
+            return B()
+
+    aio.configure(max_concurrency=2)
+    results = asyncio.run(aio.convert_many([A() for _ in range(8)], B))
+    assert len(results) == 8
+    assert state["max"] <= 2
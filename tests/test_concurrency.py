@@ -0,0 +1,68 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from chimere.core import convert
+from chimere.registry import register_adapter, get_snapshot, ADAPTERS
+from chimere.types import BaseRepresentation, JSONData, CSVData, PythonDictData
+
+
+class _PluginData(BaseRepresentation):
+    def __init__(self, data):
+        self.data = data
+
+
+def test_registration_publishes_new_snapshot():
+    class _Target(BaseRepresentation):
+        pass
+
+    before = get_snapshot()
+    # Aucun chemin : l'absence de chemin est mise en cache pour cette version
+    try:
+        convert(PythonDictData({"a": 1}), _Target)
+    except ValueError:
+        pass
+
+    @register_adapter(PythonDictData, _Target, cost=1)
+    class _DictToTarget:
+        def convert(self, obj):
+            return _Target()
+
+    after = get_snapshot()
+    assert after.version > before.version
+    assert (PythonDictData, _Target) not in before.adapters
+    assert ADAPTERS[(PythonDictData, _Target)]['class'] is _DictToTarget
+    # Le cache négatif de l'ancienne version n'est plus utilisé
+    assert isinstance(convert(PythonDictData({"a": 1}), _Target), _Target)
+
+
+def test_concurrent_convert_and_register():
+    n_types = 50
+    errors = []
+    start = threading.Barrier(5)
+    version_before = get_snapshot().version
+
+    def register_many():
+        start.wait()
+        for i in range(n_types):
+            new_type = type(f"_Plugin{i}", (_PluginData,), {})
+            register_adapter(PythonDictData, new_type, cost=10 + i)(
+                type(f"_DictToPlugin{i}", (), {"convert": lambda self, obj, t=new_type: t(obj.data)})
+            )
+
+    def convert_many():
+        start.wait()
+        for i in range(200):
+            try:
+                result = convert(JSONData('{"name": "Bob", "age": %d}' % i), CSVData)
+                assert str(i) in result.content
+            except Exception as e:  # pragma: no cover - remonté par l'assertion finale
+                errors.append(e)
+
+    with ThreadPoolExecutor(max_workers=5) as pool:
+        futures = [pool.submit(register_many)] + [pool.submit(convert_many) for _ in range(4)]
+        for future in futures:
+            future.result()
+
+    assert errors == []
+    # Aucun enregistrement perdu
+    assert get_snapshot().version == version_before + n_types
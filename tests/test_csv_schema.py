@@ -0,0 +1,79 @@
+import pandas as pd
+import pytest
+
+from chimere.core import convert
+from chimere.csv_schema import SCHEMA_CACHE, header_signature, read_csv, register_csv_schema
+from chimere.types import CSVData, PandasDataFrameData
+
+
+@pytest.fixture(autouse=True)
+def empty_cache():
+    SCHEMA_CACHE.clear()
+    yield
+    SCHEMA_CACHE.clear()
+
+
+def _payload(start):
+    rows = ''.join(f"{i},{'ab'[i % 2]},{i / 2}\n" for i in range(start, start + 10))
+    return "id,kind,value\n" + rows
+
+
+def test_schema_inferred_once_and_reused():
+    first = convert(CSVData(_payload(0)), PandasDataFrameData).df
+    assert SCHEMA_CACHE.stats.misses == 1
+    assert isinstance(first["kind"].dtype, pd.CategoricalDtype)
+
+    second = convert(CSVData(_payload(10).encode()), PandasDataFrameData).df
+    assert SCHEMA_CACHE.stats.hits == 1
+    assert second.dtypes.tolist() == first.dtypes.tolist()
+    assert second["id"].tolist() == list(range(10, 20))
+    assert second["kind"].astype(str).tolist() == ["ab"[i % 2] for i in range(10, 20)]
+
+
+def test_header_signature(tmp_path):
+    path = tmp_path / "in.csv"
+    path.write_text('"a,b",c\r\n1,2\r\n')
+    assert header_signature(CSVData(path)) == ("a,b", "c")
+    assert header_signature(CSVData(memoryview(b"x,y\n1,2\n"))) == ("x", "y")
+    assert header_signature(CSVData("")) is None
+
+
+def test_incompatible_payload_reinfers():
+    convert(CSVData("id,kind\n1,a\n2,a\n"), PandasDataFrameData)
+    # Valeur décimale dans une colonne entière : pas de troncature silencieuse
+    df = convert(CSVData("id,kind\n1.5,a\n"), PandasDataFrameData).df
+    assert df["id"].tolist() == [1.5]
+    assert SCHEMA_CACHE.stats.invalidations == 1
+
+    # Valeur manquante dans une colonne entière
+    convert(CSVData("n,kind\n1,a\n"), PandasDataFrameData)
+    df = convert(CSVData("n,kind\n,a\n"), PandasDataFrameData).df
+    assert df["n"].isna().all()
+    assert SCHEMA_CACHE.stats.invalidations == 2
+
+
+def test_no_schema_from_empty_columns():
+    convert(CSVData("id,amount\n"), PandasDataFrameData)
+    assert ("id", "amount") not in SCHEMA_CACHE
+    df = convert(CSVData("id,amount\n1,2.5\n2,3.5\n"), PandasDataFrameData).df
+    assert df["amount"].tolist() == [2.5, 3.5]
+
+    convert(CSVData("k,note\n1,\n2,\n"), PandasDataFrameData)
+    assert set(SCHEMA_CACHE.get(("k", "note")).dtypes) == {"k"}
+    df = convert(CSVData("k,note\n3,4.5\n"), PandasDataFrameData).df
+    assert df["note"].tolist() == [4.5]
+
+
+def test_explicit_schema(tmp_path):
+    path = tmp_path / "typed.csv"
+    path.write_text("x,y\n1,2.5\n3,4.5\n")
+    df = convert(CSVData(path, schema={"x": "int32", "y": "float32"}), PandasDataFrameData).df
+    assert df.dtypes.tolist() == [pd.api.types.pandas_dtype("int32"), pd.api.types.pandas_dtype("float32")]
+    assert "x" not in SCHEMA_CACHE
+
+    with pytest.raises(ValueError):
+        read_csv(CSVData("x,y\nfoo,1\n", schema={"x": "int32", "y": "float32"}))
+
+    register_csv_schema(["x", "y"], {"x": "int16", "y": "category"})
+    df = read_csv(CSVData("x,y\n1,2.5\n"))
+    assert str(df["x"].dtype) == "int16" and isinstance(df["y"].dtype, pd.CategoricalDtype)
@@ -0,0 +1,69 @@
+import pandas as pd
+import pytest
+
+from chimere.core import DISPATCH_CACHE, PATH_CACHE, convert, resolve_dispatch
+from chimere.registry import get_snapshot, register_adapter
+from chimere.types import BaseRepresentation, CSVData, JSONData, PandasDataFrameData, PythonDictData
+
+
+class TaggedJSON(JSONData):
+    tag = "events"
+
+
+class TaggedFrame(PandasDataFrameData):
+    pass
+
+
+
+def test_subclass_uses_base_class_adapters():
+    result = convert(TaggedJSON('{"name": "Bob", "age": 25}'), CSVData)
+    assert result.content.splitlines() == ["name,age", "Bob,25"]
+    df = convert(TaggedFrame(pd.DataFrame({"a": [1]})), PythonDictData).data
+    assert df == {"a": 1}
+    # Ni route ni route absente calculée pour la sous-classe elle-même
+    assert TaggedJSON not in PATH_CACHE.get(get_snapshot().version, {})
+
+
+def test_dispatch_resolved_once_per_concrete_class(monkeypatch):
+    from chimere import core
+    calls = []
+    original = core._dispatch
+    monkeypatch.setattr(core, "_dispatch", lambda *args: calls.append(args) or original(*args))
+    TaggedAgain = type("TaggedAgain", (TaggedJSON,), {})
+    for _ in range(3):
+        assert resolve_dispatch(TaggedAgain, PythonDictData) == (JSONData, PythonDictData)
+        convert(TaggedAgain('{"a": 1}'), PythonDictData)
+    assert len(calls) == 1
+    assert DISPATCH_CACHE[get_snapshot().version][(TaggedAgain, PythonDictData, None)] == (JSONData, PythonDictData)
+
+
+def test_instance_of_target_is_returned_unchanged():
+    obj = TaggedJSON('{"a": 1}')
+    assert convert(obj, JSONData) is obj
+
+
+def test_target_subtypes_and_ambiguity(make_types, adapter_to):
+    Source, Target = make_types("Source", "Target")
+    Tagged = type("TaggedTarget", (Target,), {})
+    register_adapter(Source, Tagged, cost=1)(adapter_to(Tagged))
+    assert isinstance(convert(Source(), Target), Tagged)
+
+    Other = type("OtherTarget", (Target,), {})
+    register_adapter(Source, Other, cost=1)(adapter_to(Other))
+    with pytest.raises(ValueError, match="ambiguë"):
+        convert(Source(), Target)
+
+    # Une route vers la cible exacte est toujours préférée
+    register_adapter(Source, Target, cost=5)(adapter_to(Target))
+    assert type(convert(Source(), Target)) is Target
+
+
+def test_most_specific_registered_class_wins():
+    Base = type("Base", (BaseRepresentation,), {})
+    Child = type("Child", (Base,), {})
+    Leaf = type("Leaf", (Child,), {})
+    Out = type("Out", (BaseRepresentation,), {})
+    register_adapter(Base, Out, cost=1)(type("FromBase", (), {"convert": lambda self, obj: "base"}))
+    register_adapter(Child, Out, cost=3)(type("FromChild", (), {"convert": lambda self, obj: "child"}))
+    assert convert(Leaf(), Out) == "child"
+    assert resolve_dispatch(Leaf, Out) == (Child, Out)
@@ -0,0 +1,63 @@
+import io
+import json
+
+import pytest
+
+from chimere import jsonlines
+from chimere.core import convert
+from chimere.types import JSONLinesData, PandasDataFrameData, PythonDictData
+
+
+@pytest.fixture
+def parallel(monkeypatch):
+    # Force le découpage en plusieurs processus dès quelques octets
+    monkeypatch.setattr(jsonlines, "PARALLEL_MIN_BYTES", 0)
+    monkeypatch.setattr(jsonlines, "MIN_RANGE_BYTES", 16)
+
+
+def _lines(n, bad=()):
+    return "".join("{oops\n" if i in bad else json.dumps({"id": i, "v": i * 2}) + "\n" for i in range(n))
+
+
+def test_split_ranges_on_line_boundaries():
+    data = _lines(50).encode()
+    ranges = jsonlines.split_ranges(data, 4)
+    assert len(ranges) == 4
+    assert ranges[0][0] == 0 and ranges[-1][1] == len(data)
+    assert all(prev[1] == nxt[0] for prev, nxt in zip(ranges, ranges[1:]))
+    assert all(data[end - 1:end] == b"\n" for _, end in ranges)
+
+
+def test_round_trip_dict_and_dataframe():
+    records = [{"id": 1, "name": "a"}, {"id": 2, "name": "b"}]
+    jsonl = convert(PythonDictData(records), JSONLinesData)
+    assert jsonl.content.splitlines() == [json.dumps(r) for r in records]
+    assert convert(jsonl, PythonDictData).data == records
+    df = convert(jsonl, PandasDataFrameData).df
+    assert df.to_dict(orient="records") == records
+    assert convert(PandasDataFrameData(df), JSONLinesData).content.count("\n") == 2
+
+
+def test_parallel_parse_preserves_order(parallel, tmp_path):
+    path = tmp_path / "events.jsonl"
+    path.write_text(_lines(200))
+    expected = [{"id": i, "v": i * 2} for i in range(200)]
+    assert convert(JSONLinesData(path, workers=4), PythonDictData).data == expected
+    assert convert(JSONLinesData(_lines(200).encode(), workers=3), PythonDictData).data == expected
+
+
+def test_error_tolerant_mode_reports_line_numbers(parallel):
+    content = _lines(120, bad={3, 77, 119})
+    result = convert(JSONLinesData(content, errors="skip", workers=4), PandasDataFrameData)
+    assert len(result.df) == 117
+    assert [bad.line for bad in result.bad_lines] == [4, 78, 120]
+    assert convert(JSONLinesData(_lines(3)), PythonDictData).bad_lines == ()
+
+    with pytest.raises(ValueError, match="ligne 4"):
+        convert(JSONLinesData(content, workers=4), PythonDictData)
+
+
+def test_write_to_stream():
+    stream = io.BytesIO()
+    convert(PythonDictData({"k": 1}), JSONLinesData, output=stream)
+    assert stream.getvalue() == b'{"k": 1}\n'
@@ -0,0 +1,73 @@
+import json
+import os
+import tracemalloc
+
+import pandas as pd
+
+from chimere.core import convert, get_snapshot, _execute
+from chimere.memory import SpillStore, estimate_size
+from chimere.types import JSONData, CSVData, PandasDataFrameData, PythonDictData
+
+
+def test_estimate_size():
+    df = pd.DataFrame({"a": range(1000)})
+    assert estimate_size(PandasDataFrameData(df)) >= 8000
+    assert estimate_size(JSONData("x" * 1000)) >= 1000
+    assert estimate_size(PythonDictData({"a": "x" * 1000})) >= 1000
+
+
+def test_convert_with_budget_matches_unbudgeted():
+    records = [{"name": f"user{i}", "age": i} for i in range(200)]
+    json_obj = JSONData(json.dumps(records))
+    expected = convert(json_obj, CSVData).content
+    assert convert(json_obj, CSVData, memory_budget=1).content == expected
+
+
+def test_intermediates_spill_above_budget():
+    df = pd.DataFrame({"name": [f"user{i}" for i in range(50_000)], "age": range(50_000)})
+    df_obj = PandasDataFrameData(df)
+    path = [PandasDataFrameData, CSVData, PandasDataFrameData]
+    snapshot = get_snapshot()
+    in_memory, unbounded = _execute(snapshot, [(0, path)], df_obj, memory_budget=1 << 40, optimize=False)
+    spilled, bounded = _execute(snapshot, [(0, path)], df_obj, memory_budget=1, optimize=False)
+    assert spilled.df.equals(in_memory.df)
+    assert [hop.spilled for hop in bounded.hops] == [True, False]
+    assert [hop.spilled for hop in unbounded.hops] == [False, False]
+    # Le CSV intermédiaire est écrit sur disque au lieu d'être construit en
+    # mémoire, puis relu depuis le fichier mappé
+    assert bounded.hops[0].peak < unbounded.hops[0].peak
+    assert bounded.hops[1].peak < unbounded.hops[1].peak
+    assert bounded.peak < unbounded.peak
+
+
+def test_dataframe_intermediate_spilled_to_arrow():
+    csv_obj = CSVData("id,score\n" + "".join(f"{i},{i / 4}\n" for i in range(1000)))
+    expected = convert(csv_obj, JSONData).content
+    result, report = convert(csv_obj, JSONData, memory_budget=1, return_report=True)
+    assert result.content == expected
+    assert [hop.adapter for hop in report.hops][0] == "CSVToDataFrameAdapter"
+    assert [hop.spilled for hop in report.hops] == [True] + [False] * (len(report.hops) - 1)
+    assert convert(csv_obj, JSONData, return_report=True)[1] is None
+
+
+def test_caller_tracemalloc_session_peak_preserved():
+    tracemalloc.start()
+    try:
+        block = bytearray(1 << 22)
+        del block
+        peak = tracemalloc.get_traced_memory()[1]
+        convert(CSVData("a\n1\n"), JSONData, memory_budget=1)
+        assert tracemalloc.is_tracing()
+        assert tracemalloc.get_traced_memory()[1] >= peak
+    finally:
+        tracemalloc.stop()
+
+
+def test_spill_store_roundtrip_and_cleanup():
+    store = SpillStore()
+    df_obj = PandasDataFrameData(pd.DataFrame({"a": [1, 2], "b": ["x", "y"]}))
+    spilled = store.spill(df_obj, estimate_size(df_obj))
+    assert os.path.exists(spilled.path)
+    assert store.load(spilled).df.equals(df_obj.df)
+    store.cleanup()
+    assert not os.path.exists(spilled.path)
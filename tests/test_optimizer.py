@@ -0,0 +1,80 @@
+import io
+import json
+
+import pytest
+
+import chimere
+from chimere.adapters import (
+    DictToDataFrameAdapter, DataFrameToCSVAdapter, JSONToCSVFusion, JSONToDictAdapter
+)
+from chimere.core import convert
+from chimere.optimizer import apply_chain, match_fusion, remove_round_trips
+from chimere.registry import get_snapshot
+from chimere.types import CSVData, JSONData, PandasDataFrameData, PythonDictData, XMLData
+
+PAYLOADS = [
+    {"name": "Bob", "age": 25},
+    {"text": 'a,"b"\nc', "ratio": 0.1 + 0.2, "flag": True, "none": None, "big": 2 ** 70, "nested": [1, {"x": 2}]},
+    {"nan": float("nan"), "inf": float("inf")},
+    [{"id": 1}, {"id": 2}],
+    {},
+]
+
+
+@pytest.mark.parametrize("payload", PAYLOADS)
+def test_fused_and_unfused_outputs_identical(payload, tmp_path):
+    json_obj = JSONData(json.dumps(payload))
+    fused = convert(json_obj, CSVData).content
+    assert fused == convert(json_obj, CSVData, optimize=False).content
+
+    convert(json_obj, CSVData, output=tmp_path / "fused.csv")
+    convert(json_obj, CSVData, output=tmp_path / "unfused.csv", optimize=False)
+    assert (tmp_path / "fused.csv").read_bytes() == (tmp_path / "unfused.csv").read_bytes()
+
+    if isinstance(payload, dict):
+        assert convert(json_obj, PandasDataFrameData).df.equals(
+            convert(json_obj, PandasDataFrameData, optimize=False).df
+        )
+
+
+def test_xml_to_json_fusion_identical():
+    xml_obj = XMLData("<root>Hi</root>")
+    assert convert(xml_obj, JSONData).content == convert(xml_obj, JSONData, optimize=False).content
+    stream = io.StringIO()
+    convert(xml_obj, JSONData, output=stream)
+    assert stream.getvalue() == '{"root": "Hi"}'
+
+
+def test_plan_uses_longest_fusion():
+    explanation = chimere.explain(JSONData, CSVData)
+    assert [hop.adapter for hop in explanation.hops] == ["JSONToCSVFusion"]
+    assert explanation.cost == chimere.explain(JSONData, CSVData, optimize=False).cost
+
+    snapshot = get_snapshot()
+    path = [JSONData, PythonDictData, PandasDataFrameData, CSVData]
+    end, info = match_fusion(snapshot, path, 0)
+    assert end == 3 and info["class"] is JSONToCSVFusion
+    end, info = match_fusion(snapshot, path, 0, disabled={info["adapters"]})
+    assert end == 2 and info["class"].__name__ == "JSONToDataFrameFusion"
+
+
+def test_invalid_input_still_rejected():
+    with pytest.raises(ValueError, match="JSON invalide"):
+        convert(JSONData("{invalid"), CSVData)
+
+
+def test_remove_lossless_round_trips_only():
+    snapshot = get_snapshot()
+    path = [PythonDictData, JSONData, PythonDictData, PandasDataFrameData]
+    assert remove_round_trips(snapshot, path) == [PythonDictData, PandasDataFrameData]
+    # dict -> XML -> dict normalise la donnée (fidélité medium) : conservé
+    lossy = [PythonDictData, XMLData, PythonDictData]
+    assert remove_round_trips(snapshot, lossy) == lossy
+
+
+def test_apply_chain_matches_fusion():
+    data = PythonDictData({"a": 1, "b": "x"})
+    chained = apply_chain((DictToDataFrameAdapter, DataFrameToCSVAdapter), data)
+    fused = JSONToCSVFusion().convert(JSONData(json.dumps(data.data)))
+    assert chained.content == fused.content
+    assert apply_chain((JSONToDictAdapter,), JSONData('{"k": 1}')).data == {"k": 1}
@@ -0,0 +1,87 @@
+import ctypes
+import json
+
+import pandas as pd
+import pytest
+
+from chimere.core import _resolve_routes, convert, get_snapshot
+from chimere.dynamic_types import DynamicStructData
+from chimere.exceptions import ValidationError
+from chimere.metadata import MetadataRegistry
+from chimere.packed import PackedStructData
+from chimere.types import PythonDictData, PandasDataFrameData
+
+
+@pytest.fixture
+def packed_type(tmp_path):
+    config_path = tmp_path / "config.json"
+    config_path.write_text(json.dumps({
+        "PackedPoint": {
+            "dll_path": str(tmp_path / "unused.dll"),
+            "function_prefix": "create_point",
+            "fields": {"name": {"type": "str", "ctype": "c_char_p", "nullable": True},
+                       "age": {"type": "int", "ctype": "c_int"},
+                       "score": {"type": "float", "ctype": "c_double"}},
+        }
+    }))
+    MetadataRegistry.register_from_json(config_path)
+    return PackedStructData.for_structure("PackedPoint")
+
+
+def test_layout_matches_ctypes(packed_type):
+    codec = packed_type.codec_for()
+    assert codec.size == ctypes.sizeof(codec.struct_type)
+    assert codec.record.size == codec.size
+
+
+def test_dict_roundtrip(packed_type):
+    data = {"name": "Alice", "age": 30, "score": 1.5}
+    packed = convert(PythonDictData(data), packed_type)
+    assert isinstance(packed, packed_type)
+    assert convert(packed, PythonDictData).data == data
+
+
+def test_dataframe_roundtrip(packed_type):
+    df = pd.DataFrame({"name": ["a", "bb", "ccc"], "age": [1, 2, 3], "score": [0.5, 1.5, 2.5]})
+    packed = convert(PandasDataFrameData(df), packed_type)
+    assert packed.count == 3
+    df_back = convert(packed, PandasDataFrameData).df
+    assert df_back["name"].tolist() == ["a", "bb", "ccc"]
+    assert df_back["age"].tolist() == [1, 2, 3]
+    assert df_back["score"].tolist() == [0.5, 1.5, 2.5]
+
+
+def test_ctypes_view_shares_buffer(packed_type):
+    packed = convert(PythonDictData([{"name": "x", "age": 1, "score": 0.0},
+                                     {"name": None, "age": 2, "score": 0.0}]), packed_type)
+    array = packed.as_ctypes()
+    assert array[0].name == b"x" and array[1].name is None
+    array[1].age = 42
+    assert [r["age"] for r in packed.records()] == [1, 42]
+    # La copie portable conserve des offsets relatifs
+    copy = packed_type(packed.tobytes())
+    assert list(copy.records()) == list(packed.records())
+
+
+def test_dynamic_struct_roundtrip(packed_type):
+    packed = convert(PythonDictData({"name": "Bob", "age": 7, "score": 2.0}), packed_type)
+    struct_obj = convert(packed, DynamicStructData)
+    assert struct_obj.ptr.contents.name == b"Bob"
+    back = convert(struct_obj, PackedStructData)
+    assert list(back.records()) == [{"name": "Bob", "age": 7, "score": 2.0}]
+
+
+def test_missing_field(packed_type):
+    with pytest.raises(ValidationError):
+        convert(PythonDictData({"name": "Bob"}), packed_type)
+
+
+def test_packed_schema_never_chosen_implicitly(packed_type):
+    routes = _resolve_routes(PythonDictData, DynamicStructData, 10, None, get_snapshot())
+    assert not any(issubclass(t, PackedStructData) for _, path in routes for t in path)
+    # L'adaptateur direct mal configuré échoue sans repli sur le schéma packed
+    with pytest.raises(TypeError):
+        convert(PythonDictData({"name": "Bob", "age": 3, "score": 0.5}), DynamicStructData)
+    # Depuis un objet packed fourni par l'appelant, l'adaptateur reste utilisable
+    packed = convert(PythonDictData({"name": "Bob", "age": 3, "score": 0.5}), packed_type)
+    assert convert(packed, DynamicStructData).ptr.contents.age == 3
@@ -0,0 +1,32 @@
+import pytest
+
+import chimere
+from chimere.types import JSONData, CSVData, PythonDictData, ERRORData
+
+
+def test_explain_without_analyze():
+    explanation = chimere.explain(JSONData('{"a": 1}'), CSVData)
+    assert explanation.path[0] is JSONData and explanation.path[-1] is CSVData
+    assert explanation.cost == sum(hop.cost for hop in explanation.hops)
+    assert all(hop.wall_time is None for hop in explanation.hops)
+    assert explanation.result is None
+
+
+def test_explain_analyze_reports_each_hop():
+    explanation = chimere.explain(JSONData('{"name": "Bob", "age": 25}'), CSVData, analyze=True, profile=True,
+                                  optimize=False)
+    assert isinstance(explanation.result, CSVData)
+    for hop in explanation.hops:
+        assert hop.wall_time >= 0 and hop.cpu_time >= 0
+        assert hop.input_size > 0 and hop.output_size > 0
+        assert hop.peak_alloc >= 0
+        assert "function calls" in hop.profile
+    rows = explanation.rows()
+    assert [row['adapter'] for row in rows] == [hop.adapter for hop in explanation.hops]
+    assert "JSONToDictAdapter" in explanation.to_table()
+
+
+def test_explain_accepts_type_and_rejects_missing_route():
+    assert chimere.explain(JSONData, PythonDictData).hops[0].adapter == "JSONToDictAdapter"
+    with pytest.raises(ValueError, match="Aucun chemin"):
+        chimere.explain(JSONData, ERRORData)
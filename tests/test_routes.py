@@ -0,0 +1,162 @@
+from chimere.core import PATH_CACHE, find_conversion_path
+from chimere.registry import register_adapter, get_snapshot
+
+
+def test_negative_route_becomes_available(make_types, adapter_to):
+    A, B, C = make_types("A", "B", "C")
+    register_adapter(A, B, cost=1)(adapter_to(B))
+    assert find_conversion_path(A, C) == (None, None)
+
+    register_adapter(B, C, cost=1)(adapter_to(C))
+    assert find_conversion_path(A, C) == (2, [A, B, C])
+
+
+def test_unrelated_routes_stay_warm(make_types, adapter_to):
+    A, B, X, Y = make_types("A", "B", "X", "Y")
+    register_adapter(A, B, cost=1)(adapter_to(B))
+    register_adapter(X, Y, cost=1)(adapter_to(Y))
+    find_conversion_path(A, B)
+    find_conversion_path(X, Y)
+    tree_a = PATH_CACHE[get_snapshot().version][A]
+    tree_x = PATH_CACHE[get_snapshot().version][X]
+
+    Z, = make_types("Z")
+    register_adapter(B, Z, cost=1)(adapter_to(Z))
+    cache = PATH_CACHE[get_snapshot().version]
+    # Seul l'arbre qui atteint B est recalculé
+    assert cache[X] is tree_x
+    assert cache[A] is not tree_a
+    assert find_conversion_path(A, Z) == (2, [A, B, Z])
+
+
+def test_cost_changes_update_routes(make_types, adapter_to):
+    A, B, C, D = make_types("A", "B", "C", "D")
+    register_adapter(A, B, cost=1)(adapter_to(B))
+    register_adapter(B, D, cost=1)(adapter_to(D))
+    register_adapter(A, C, cost=2)(adapter_to(C))
+    register_adapter(C, D, cost=2)(adapter_to(D))
+    assert find_conversion_path(A, D) == (2, [A, B, D])
+
+    # Hausse de coût d'une arête utilisée : bascule sur l'autre route
+    register_adapter(B, D, cost=10)(adapter_to(D))
+    assert find_conversion_path(A, D) == (4, [A, C, D])
+
+    # Baisse de coût : la route initiale redevient la meilleure
+    register_adapter(A, B, cost=0)(adapter_to(B))
+    register_adapter(B, D, cost=1)(adapter_to(D))
+    assert find_conversion_path(A, D) == (1, [A, B, D])
+
+
+def test_k_best_routes_and_constraints(make_types, adapter_to):
+    from chimere.core import RouteConstraints, find_conversion_paths
+
+    A, B, C, D = make_types("A", "B", "C", "D")
+    register_adapter(A, D, cost=5, fidelity='low')(adapter_to(D))
+    register_adapter(A, B, cost=1)(adapter_to(B))
+    register_adapter(B, D, cost=1)(adapter_to(D))
+    register_adapter(A, C, cost=1)(adapter_to(C))
+    low = register_adapter(C, D, cost=2, fidelity='low')(adapter_to(D))
+
+    assert find_conversion_paths(A, D, k=3) == [(2, [A, B, D]), (3, [A, C, D]), (5, [A, D])]
+    high_only = RouteConstraints(min_fidelity='high')
+    assert find_conversion_paths(A, D, k=3, constraints=high_only) == [(2, [A, B, D])]
+    assert find_conversion_paths(A, D, k=3, constraints=RouteConstraints(max_hops=1)) == [(5, [A, D])]
+    no_low = RouteConstraints(exclude={low})
+    assert [p for _, p in find_conversion_paths(A, D, k=3, constraints=no_low)] == [[A, B, D], [A, D]]
+
+
+def test_convert_falls_back_from_last_good_intermediate(make_types):
+    from chimere.core import convert
+
+    A, B, C, D = make_types("A", "B", "C", "D")
+    calls = []
+
+    def adapter(target, fail=False):
+        def convert_(self, obj):
+            calls.append(target.__name__)
+            if fail:
+                raise ValueError("échec")
+            return target()
+        return type(f"To{target.__name__}", (), {"convert": convert_})
+
+    register_adapter(A, B, cost=1)(adapter(B))
+    register_adapter(B, D, cost=1)(adapter(D, fail=True))
+    register_adapter(B, C, cost=2)(adapter(C))
+    register_adapter(C, D, cost=2)(adapter(D))
+
+    assert isinstance(convert(A(), D), D)
+    # A -> B n'est exécuté qu'une fois, puis B -> C -> D remplace B -> D
+    assert calls == ["B", "D", "C", "D"]
+
+
+def test_convert_raises_first_error_without_alternative(make_types):
+    import pytest
+    from chimere.core import convert
+
+    A, B = make_types("A", "B")
+
+    class Failing:
+        def convert(self, obj):
+            raise ValueError("échec direct")
+
+    register_adapter(A, B)(Failing)
+    with pytest.raises(ValueError, match="échec direct"):
+        convert(A(), B)
+
+
+def test_fallback_only_on_conversion_errors_and_as_faithful_routes(make_types, adapter_to):
+    import pytest
+    from chimere.core import RouteConstraints, convert
+
+    A, B, C = make_types("A", "B", "C")
+
+    class Misconfigured:
+        def __init__(self, target_type):
+            self.target_type = target_type
+
+        def convert(self, obj):
+            return B()
+
+    register_adapter(A, B, cost=1)(Misconfigured)
+    register_adapter(A, C, cost=1)(adapter_to(C))
+    register_adapter(C, B, cost=1)(adapter_to(B))
+    # Erreur de programmation : pas de repli
+    with pytest.raises(TypeError):
+        convert(A(), B)
+
+    X, Y, Z = make_types("X", "Y", "Z")
+
+    class Rejecting:
+        def convert(self, obj):
+            raise ValueError("donnée refusée")
+
+    register_adapter(X, Y, cost=1, fidelity='high')(Rejecting)
+    register_adapter(X, Z, cost=1, fidelity='low')(adapter_to(Z))
+    register_adapter(Z, Y, cost=1, fidelity='high')(adapter_to(Y))
+    # La route de repli perd de l'information : refusée par défaut
+    with pytest.raises(ValueError, match="donnée refusée"):
+        convert(X(), Y)
+    assert isinstance(convert(X(), Y, constraints=RouteConstraints(lossier_fallback=True)), Y)
+
+
+def test_unrelated_registration_keeps_k_best_and_dispatch_entries(make_types, adapter_to):
+    from chimere.core import ALTERNATIVES_CACHE, DISPATCH_CACHE, find_conversion_paths, resolve_dispatch
+
+    A, B, C, X, Y = make_types("A", "B", "C", "X", "Y")
+    register_adapter(A, B, cost=1)(adapter_to(B))
+    register_adapter(B, C, cost=1)(adapter_to(C))
+    find_conversion_paths(A, C, k=3)
+    resolve_dispatch(A, C)
+    entry = ALTERNATIVES_CACHE[get_snapshot().version][(A, C, 3, None)]
+    dispatch = DISPATCH_CACHE[get_snapshot().version][(A, C, None)]
+
+    register_adapter(X, Y, cost=1)(adapter_to(Y))
+    version = get_snapshot().version
+    assert ALTERNATIVES_CACHE[version][(A, C, 3, None)] is entry
+    assert DISPATCH_CACHE[version][(A, C, None)] is dispatch
+
+    # Une arête partant d'un type atteint invalide l'entrée
+    register_adapter(A, C, cost=5)(adapter_to(C))
+    version = get_snapshot().version
+    assert (A, C, 3, None) not in ALTERNATIVES_CACHE.get(version, {})
+    assert [p for _, p in find_conversion_paths(A, C, k=3)] == [[A, B, C], [A, C]]
@@ -0,0 +1,119 @@
+import json
+import multiprocessing
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from chimere.core import convert
+from chimere.exceptions import ValidationError
+from chimere.metadata import MetadataRegistry
+from chimere.packed import PackedStructData
+from chimere.shared import SharedMemoryData
+from chimere.types import PandasDataFrameData, PythonDictData
+
+
+def _sum_in_child(name):
+    shared = SharedMemoryData.attach(name)
+    df = convert(shared, PandasDataFrameData).df
+    return float(df["value"].sum()), df["label"].tolist()
+
+
+def test_dataframe_roundtrip_zero_copy():
+    df = pd.DataFrame({"value": np.arange(5, dtype="float64"),
+                       "count": np.arange(5, dtype="int32"),
+                       "label": ["a", None, "ccc", "é", ""]})
+    with convert(PandasDataFrameData(df), SharedMemoryData) as shared:
+        df_obj = convert(shared, PandasDataFrameData)
+        back = df_obj.df
+        assert back["value"].tolist() == df["value"].tolist()
+        assert back["count"].dtype == np.int32
+        assert back["label"].isna().tolist() == [False, True, False, False, False]
+        assert back["label"].dropna().tolist() == ["a", "ccc", "é", ""]
+        # Les colonnes numériques pointent directement dans le segment
+        segment = np.frombuffer(shared.shm.buf, dtype=np.uint8)
+        assert np.shares_memory(back["value"].to_numpy(), segment)
+        del back, df_obj, segment
+
+
+def test_nullable_and_unsupported_dtypes():
+    df = pd.DataFrame({"count": pd.array([1, None, 3], dtype="Int64"),
+                       "flag": pd.array([True, None, False], dtype="boolean"),
+                       "ratio": pd.array([0.5, None, 1.5], dtype="Float64")})
+    with convert(PandasDataFrameData(df), SharedMemoryData) as shared:
+        back = convert(shared, PandasDataFrameData).df
+        assert back.dtypes.tolist() == df.dtypes.tolist()
+        assert back.equals(df)
+        del back
+
+    tz = pd.DataFrame({"at": pd.date_range("2024-01-01", periods=2, tz="UTC")})
+    with pytest.raises(ValidationError, match="at"):
+        convert(PandasDataFrameData(tz), SharedMemoryData)
+
+
+def test_attach_from_other_process():
+    df = pd.DataFrame({"value": [1.0, 2.0, 3.5], "label": ["x", "y", "z"]})
+    with convert(PandasDataFrameData(df), SharedMemoryData) as shared:
+        ctx = multiprocessing.get_context("spawn")
+        with ctx.Pool(1) as pool:
+            total, labels = pool.apply(_sum_in_child, (shared.name,))
+        assert total == 6.5
+        assert labels == ["x", "y", "z"]
+
+
+def test_segment_unlinked_on_close():
+    shared = convert(PandasDataFrameData(pd.DataFrame({"a": [1, 2]})), SharedMemoryData)
+    name = shared.name
+    shared.close()
+    with pytest.raises(FileNotFoundError):
+        SharedMemoryData.attach(name)
+
+
+def test_packed_roundtrip(tmp_path):
+    config_path = tmp_path / "config.json"
+    config_path.write_text(json.dumps({
+        "SharedPoint": {
+            "dll_path": str(tmp_path / "unused.dll"),
+            "function_prefix": "create_point",
+            "fields": {"name": {"type": "str", "ctype": "c_char_p"},
+                       "age": {"type": "int", "ctype": "c_int"}},
+        }
+    }))
+    MetadataRegistry.register_from_json(config_path)
+    packed_type = PackedStructData.for_structure("SharedPoint")
+    records = [{"name": "a", "age": 1}, {"name": "b", "age": 2}]
+    packed = convert(PythonDictData(records), packed_type)
+    with convert(packed, SharedMemoryData) as shared:
+        attached = SharedMemoryData.attach(shared.name)
+        packed_back = convert(attached, packed_type)
+        assert list(packed_back.records()) == records
+        del packed_back
+        attached.close()
+
+
+def test_packed_relocation_stays_private_to_each_attacher(tmp_path):
+    config_path = tmp_path / "config.json"
+    config_path.write_text(json.dumps({
+        "SharedLabel": {
+            "dll_path": str(tmp_path / "unused.dll"),
+            "function_prefix": "create_label",
+            "fields": {"name": {"type": "str", "ctype": "c_char_p"},
+                       "age": {"type": "int", "ctype": "c_int"}},
+        }
+    }))
+    MetadataRegistry.register_from_json(config_path)
+    packed_type = PackedStructData.for_structure("SharedLabel")
+    records = [{"name": "first", "age": 1}, {"name": "second", "age": 2}]
+    packed = convert(PythonDictData(records), packed_type)
+    with convert(packed, SharedMemoryData) as shared:
+        first = SharedMemoryData.attach(shared.name)
+        second = SharedMemoryData.attach(shared.name)
+        relocated = convert(first, packed_type)
+        array = relocated.as_ctypes()
+        assert [array[i].name for i in range(2)] == [b"first", b"second"]
+        other = convert(second, packed_type)
+        assert list(other.records()) == records
+        assert other.flags == 0
+        del relocated, array, other
+        first.close()
+        second.close()
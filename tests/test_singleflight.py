@@ -0,0 +1,162 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pandas as pd
+import pytest
+
+from chimere import aio
+from chimere.core import convert
+from chimere.registry import register_adapter
+from chimere.singleflight import SINGLE_FLIGHT, content_key
+from chimere.types import BaseRepresentation, JSONData, PandasDataFrameData
+
+
+class Payload(BaseRepresentation):
+    def __init__(self, value):
+        self.value = value
+
+
+class Exported(BaseRepresentation):
+    def __init__(self, value):
+        self.value = value
+
+
+class Broken(BaseRepresentation):
+    pass
+
+
+ENTERED = threading.Event()
+RELEASE = threading.Event()
+CALLS = []
+
+
+@register_adapter(Payload, Exported, cost=1)
+class SlowExportAdapter:
+    def convert(self, obj):
+        CALLS.append(obj.value)
+        ENTERED.set()
+        RELEASE.wait(5)
+        if obj.value == "fail":
+            raise RuntimeError("export impossible")
+        return Exported(obj.value.upper())
+
+
+@pytest.fixture(autouse=True)
+def reset():
+    CALLS.clear()
+    ENTERED.clear()
+    RELEASE.clear()
+    SINGLE_FLIGHT.reset_stats()
+    yield
+    RELEASE.set()
+
+
+def _wait_coalesced(n):
+    deadline = time.monotonic() + 5
+    while SINGLE_FLIGHT.stats.coalesced < n and time.monotonic() < deadline:
+        time.sleep(0.005)
+
+
+def _burst(objs, coalesce=True):
+    with ThreadPoolExecutor(max_workers=len(objs)) as pool:
+        futures = [pool.submit(convert, objs[0], Exported, coalesce=coalesce)]
+        ENTERED.wait(5)
+        futures += [pool.submit(convert, obj, Exported, coalesce=coalesce) for obj in objs[1:]]
+        if coalesce:
+            _wait_coalesced(len(objs) - 1)
+        RELEASE.set()
+        return futures
+
+
+def test_concurrent_calls_share_one_execution():
+    payload = Payload("parquet")
+    results = [f.result() for f in _burst([payload] * 5)]
+    assert CALLS == ["parquet"]
+    assert all(r is results[0] for r in results) and results[0].value == "PARQUET"
+    assert SINGLE_FLIGHT.stats.executions == 1 and SINGLE_FLIGHT.stats.coalesced == 4
+    assert SINGLE_FLIGHT.in_flight() == 0
+
+
+def test_failure_propagates_to_every_waiter():
+    futures = _burst([Payload("fail")] * 3)
+    for future in futures:
+        with pytest.raises(RuntimeError, match="export impossible"):
+            future.result()
+    assert CALLS == ["fail"]
+    assert SINGLE_FLIGHT.stats.failures == 1 and SINGLE_FLIGHT.stats.coalesced == 2
+
+
+def test_not_coalesced_by_default_or_across_objects():
+    RELEASE.set()
+    payload = Payload("a")
+    convert(payload, Exported)
+    convert(payload, Exported)
+    convert(Payload("a"), Exported, coalesce=True)
+    assert CALLS == ["a", "a", "a"]
+    assert SINGLE_FLIGHT.stats.coalesced == 0
+
+
+def test_content_keys():
+    assert content_key(JSONData('{"a": 1}')) == content_key(JSONData(b'{"a": 1}'))
+    assert content_key(JSONData('{"a": 1}')) != content_key(JSONData('{"a": 2}'))
+    df = pd.DataFrame({"a": [1, 2], "b": ["x", "y"]})
+    assert content_key(PandasDataFrameData(df)) == content_key(PandasDataFrameData(df.copy()))
+    assert content_key(PandasDataFrameData(df)) != content_key(PandasDataFrameData(df.astype({"a": float})))
+    assert content_key(Payload("x")) is None
+    with pytest.raises(ValueError, match="coalesce"):
+        convert(Payload("x"), Exported, coalesce="hash")
+
+
+def test_async_callers_share_execution_with_threads():
+    aio.configure()
+    payload = Payload("shared")
+
+    async def main():
+        tasks = [asyncio.create_task(aio.convert_async(payload, Exported, coalesce=True)) for _ in range(3)]
+        await asyncio.sleep(0)
+        await asyncio.get_running_loop().run_in_executor(None, ENTERED.wait, 5)
+        threaded = asyncio.get_running_loop().run_in_executor(None, lambda: convert(payload, Exported, coalesce=True))
+        await asyncio.get_running_loop().run_in_executor(None, _wait_coalesced, 3)
+        RELEASE.set()
+        return await asyncio.gather(*tasks, threaded)
+
+    results = asyncio.run(main())
+    assert CALLS == ["shared"]
+    assert all(r is results[0] for r in results)
+
+
+def test_caller_timeout_does_not_fail_other_waiters():
+    aio.configure()
+    payload = Payload("slow")
+
+    async def main():
+        impatient = asyncio.create_task(aio.convert_async(payload, Exported, timeout=0.05, coalesce=True))
+        await asyncio.get_running_loop().run_in_executor(None, ENTERED.wait, 5)
+        patient = asyncio.create_task(aio.convert_async(payload, Exported, coalesce=True))
+        await asyncio.sleep(0.1)
+        RELEASE.set()
+        return await asyncio.gather(impatient, patient, return_exceptions=True)
+
+    impatient, patient = asyncio.run(main())
+    assert isinstance(impatient, asyncio.TimeoutError)
+    assert patient.value == "SLOW"
+    assert CALLS == ["slow"]
+
+
+def test_shared_execution_abandoned_when_nobody_waits():
+    aio.configure()
+    payload = Payload("abandoned")
+
+    async def main():
+        with pytest.raises(asyncio.TimeoutError):
+            await aio.convert_async(payload, Exported, timeout=0.05, coalesce=True)
+        assert SINGLE_FLIGHT.in_flight() == 0
+        RELEASE.set()
+        # Un nouvel appel relance la conversion
+        return await aio.convert_async(payload, Exported, coalesce=True)
+
+    assert asyncio.run(main()).value == "ABANDONED"
+    assert CALLS == ["abandoned", "abandoned"]
+    assert SINGLE_FLIGHT.stats.executions == 2
@@ -0,0 +1,96 @@
+import io
+import json
+
+import pandas as pd
+import pytest
+
+from chimere.core import convert
+from chimere.types import JSONData, CSVData, XMLData, PythonDictData, PandasDataFrameData, ParquetData
+
+
+def test_bytes_and_memoryview_sources():
+    payload = b'{"name": "Alice", "age": 30}'
+    assert convert(JSONData(payload), PythonDictData).data == {"name": "Alice", "age": 30}
+    assert convert(JSONData(memoryview(payload)), PythonDictData).data == {"name": "Alice", "age": 30}
+    df = convert(CSVData(b"a,b\n1,2\n"), PandasDataFrameData).df
+    assert df.to_dict(orient="records") == [{"a": 1, "b": 2}]
+    assert convert(XMLData(b"<root>Hi</root>"), PythonDictData).data == {"root": "Hi"}
+
+
+def test_file_backed_sources(tmp_path):
+    json_path = tmp_path / "in.json"
+    json_path.write_text('{"name": "Bob", "age": 25}')
+    json_obj = JSONData(json_path)
+    assert json_obj.path == json_path and json_obj.size() == json_path.stat().st_size
+    assert bytes(json_obj.buffer()) == json_path.read_bytes()
+    assert convert(json_obj, PythonDictData).data == {"name": "Bob", "age": 25}
+    json_obj.close()
+
+    csv_path = tmp_path / "in.csv"
+    csv_path.write_text("a,b\n1,2\n3,4\n")
+    df = convert(CSVData.from_file(csv_path), PandasDataFrameData).df
+    assert df["b"].tolist() == [2, 4]
+
+
+def test_stream_sources_read_from_current_position():
+    stream = io.BytesIO(b'ignored{"name": "Eve"}')
+    stream.seek(len(b"ignored"))
+    json_obj = JSONData(stream)
+    assert convert(json_obj, PythonDictData).data == {"name": "Eve"}
+    # Lu en continu et jamais refermé : le flux de l'appelant reste utilisable
+    assert not stream.closed and stream.tell() == len(stream.getvalue())
+    with pytest.raises(ValueError, match="déjà lu"):
+        json_obj.content
+
+    text = io.StringIO("skip\n<root>é</root>")
+    text.readline()
+    assert convert(XMLData(text), PythonDictData).data == {"root": "é"}
+
+    csv_stream = io.StringIO("# entête\na,b\n1,2\n")
+    csv_stream.readline()
+    csv_obj = CSVData(csv_stream)
+    assert convert(csv_obj, PandasDataFrameData).df["b"].tolist() == [2]
+    assert JSONData('"é"').size() == 4
+
+
+def test_invalid_bytes_json():
+    with pytest.raises(ValueError, match="JSON invalide"):
+        convert(JSONData(b"{invalid"), PythonDictData)
+
+
+def test_output_to_file_and_stream(tmp_path):
+    df_obj = PandasDataFrameData(pd.DataFrame({"a": [1, 2], "b": ["x", "y"]}))
+    out = tmp_path / "out.csv"
+    csv_obj = convert(df_obj, CSVData, output=out)
+    assert csv_obj.path == out
+    assert out.read_text() == "a,b\n1,x\n2,y\n"
+    assert csv_obj.content == "a,b\n1,x\n2,y\n"
+
+    stream = io.StringIO()
+    csv_obj = convert(df_obj, CSVData, output=stream)
+    assert stream.getvalue() == "a,b\n1,x\n2,y\n"
+    assert csv_obj.size() == len("a,b\n1,x\n2,y\n")
+    with pytest.raises(ValueError, match="non relisible"):
+        csv_obj.content
+
+    json_out = tmp_path / "out.json"
+    convert(JSONData('{"k": 1}'), JSONData, output=json_out)
+    assert json.loads(json_out.read_text()) == {"k": 1}
+
+    pq = convert(df_obj, ParquetData, output=tmp_path / "out.parquet")
+    assert pd.read_parquet(pq.path).equals(df_obj.df)
+
+
+def test_output_stream_is_not_read_back(tmp_path):
+    df_obj = PandasDataFrameData(pd.DataFrame({"a": [1, 2]}))
+    with open(tmp_path / "prefixed.csv", "w+") as stream:
+        stream.write("avant\n")
+        csv_obj = convert(df_obj, CSVData, output=stream)
+        # Position de l'appelant conservée, contenu antérieur jamais adopté
+        assert stream.tell() == len("avant\na\n1\n2\n")
+        assert csv_obj.size() == len("a\n1\n2\n")
+        assert csv_obj.memory_size() == 0
+
+    with open(tmp_path / "write_only.csv", "wb") as stream:
+        csv_obj = convert(df_obj, CSVData, output=stream, memory_budget=1 << 20)
+    assert (tmp_path / "write_only.csv").read_text() == "a\n1\n2\n"